@@ -7,90 +7,507 @@ A lightweight macOS app that:
 2. Guides users through setup if needed
 3. Launches the monitoring script with nice dialogs for options
 
+The app also registers a phocusmon:// URL scheme. Opening
+phocusmon://run?out=DIR&dur=SECONDS&interval=SECONDS skips the dialogs and
+starts monitoring after a single confirmation (all query parameters are
+optional). Any web page or app can open such a link, so the output folder
+must be inside the user's home folder.
+
 Due to macOS security restrictions around sudo and native extensions,
 we use the local venv installation rather than bundling Python.
 """
 
+import ast
+import json
 import os
 import sys
+import shlex
+import string
 import subprocess
+import tempfile
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+# URL scheme registered in the app's Info.plist (see setup.py)
+URL_SCHEME = "phocusmon"
+
+# Absolute paths let subprocess use posix_spawn (see _run_command)
+OSASCRIPT = "/usr/bin/osascript"
+
+# osascript reports this error number when the user clicks Cancel
+APPLESCRIPT_USER_CANCELED = "(-128)"
+
+# Shows an alert without the dialogs script, for when that script itself
+# fails; title and message arrive through argv, so need no escaping
+FALLBACK_ALERT_SCRIPT = (
+    '-e', 'on run argv',
+    '-e', 'display alert (item 1 of argv) message (item 2 of argv)',
+    '-e', 'end run',
+)
+PGREP = "/usr/bin/pgrep"
+OPEN = "/usr/bin/open"
+
+# Resolved once - every location below hangs off the home directory
+HOME_DIR = Path.home()
+
 # Expected location of the phocus-monitor installation
 # Users should clone/download to their home directory
-DEFAULT_INSTALL_DIR = Path.home() / "phocus-monitor"
+DEFAULT_INSTALL_DIR = HOME_DIR / "phocus-monitor"
+
+# Common installation locations, in search order
+INSTALL_DIR_CANDIDATES = (
+    DEFAULT_INSTALL_DIR,
+    HOME_DIR / "Downloads" / "phocus-monitor",
+    HOME_DIR / "Documents" / "phocus-monitor",
+)
+
+# iCloud Drive root - only searched if it's already set up on this Mac
+ICLOUD_DRIVE_DIR = HOME_DIR / "Library" / "Mobile Documents" / "com~apple~CloudDocs"
+ICLOUD_INSTALL_DIR = ICLOUD_DRIVE_DIR / "GitHub" / "phocus-monitor"
+
+# Remembers where the installation was found so later launches can skip the search
+CACHE_DIR = HOME_DIR / "Library" / "Caches" / "PhocusMonitor"
+INSTALL_DIR_CACHE = CACHE_DIR / "install_dir"
+
+# Candidate locations recently found not to hold an installation, with the
+# time they were checked. Stat-ing them again (iCloud Drive in particular)
+# can be slow, so they are skipped for a while.
+MISSING_PATHS_CACHE = CACHE_DIR / "missing_paths.json"
+MISSING_PATH_TTL = 7 * 24 * 60 * 60  # 7 days, in seconds
+
+# Output folder, duration, and interval from the last dialog-driven launch,
+# offered again on the next launch
+SETTINGS_PATH = HOME_DIR / "Library" / "Preferences" / "com.tonalphoto.phocusmonitor.json"
+
+# Touched whenever Phocus is seen running; a launch shortly afterwards
+# trusts it instead of checking again
+PHOCUS_SEEN_CACHE = CACHE_DIR / "phocus_seen"
+PHOCUS_SEEN_TTL = 60  # seconds
+
+# Shell script written to a .command file and opened in Terminal to run
+# the monitor (see launch_in_terminal). It deletes itself once started.
+TERMINAL_COMMAND_TEMPLATE = string.Template("""\
+#!/bin/bash
+rm -f "$$0"
+cd $install_dir
+$command
+echo ''
+echo 'Done! Press any key to close...'
+read -n 1
+""")
+
+# Set by whatever launched us (e.g. a Phocus-side action) when Phocus is
+# known to be running
+LAUNCHED_BY_PHOCUS_ENV = "PHOCUS_LAUNCHED_BY_PHOCUS"
+
+
+def _run_command(args, capture=True):
+    """
+    Run a command, using the posix_spawn fast path.
 
+    CPython only spawns via posix_spawn (instead of fork + exec, which copies
+    the parent's page tables) when close_fds is False and the executable is
+    an absolute path, so callers pass full paths like OSASCRIPT.
 
-def show_alert(title, message, buttons=["OK"]):
-    """Show a macOS alert dialog."""
-    # Escape special characters for AppleScript
-    message = message.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
-    buttons_str = ', '.join(f'"{b}"' for b in buttons)
-    script = f'''
-    display alert "{title}" message "{message}" buttons {{{buttons_str}}} default button 1
-    '''
-    result = subprocess.run(
-        ['osascript', '-e', script],
-        capture_output=True,
+    stdout and stderr are only piped when the caller wants them; otherwise
+    they go to /dev/null.
+
+    Args:
+        args: Command and arguments
+        capture: Whether to capture and return stdout and stderr
+
+    Returns:
+        tuple: (returncode, stdout text or None, stderr text or None)
+    """
+    proc = subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+        stderr=subprocess.PIPE if capture else subprocess.DEVNULL,
+        close_fds=False,
         text=True
     )
-    return result.stdout.strip().replace('button returned:', '')
-
-
-def show_input_dialog(prompt, default=""):
-    """Show a macOS input dialog and return the text."""
-    prompt = prompt.replace('"', '\\"')
-    script = f'''
-    display dialog "{prompt}" default answer "{default}"
-    '''
-    result = subprocess.run(
-        ['osascript', '-e', script],
-        capture_output=True,
-        text=True
+    stdout, stderr = proc.communicate()
+    return proc.returncode, stdout, stderr
+
+
+def _start_command(args):
+    """
+    Start a command without waiting for it to finish.
+
+    Used for the final hand-off to Terminal: the launcher has nothing left
+    to do afterwards, so it exits instead of blocking on the child. Same
+    posix_spawn conditions as _run_command().
+    """
+    subprocess.Popen(
+        args,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=False
     )
-    if result.returncode != 0:
+
+
+def _find_dialogs_script():
+    """
+    Locate the launcher's AppleScript dialogs.
+
+    The bundled app ships a pre-compiled dialogs.scpt in Contents/Resources;
+    when running from source we hand osascript the .applescript text instead.
+    """
+    if getattr(sys, 'frozen', False):
+        # sys.executable is .app/Contents/MacOS/Phocus Monitor
+        compiled = Path(sys.executable).parent.parent / "Resources" / "dialogs.scpt"
+        if compiled.exists():
+            return compiled
+    app_dir = Path(__file__).resolve().parent
+    compiled = app_dir / "dialogs.scpt"
+    if compiled.exists():
+        return compiled
+    return app_dir / "dialogs.applescript"
+
+
+# Resolved once at startup - every dialog goes through this script
+DIALOGS_SCRIPT = _find_dialogs_script()
+
+
+def _parse_applescript_result(text):
+    """
+    Parse osascript output printed in source form (osascript -s s).
+
+    Source form quotes and escapes strings much like Python does, so
+    strings and lists of strings ({"a", "b"}) map onto Python literals.
+    The exception is line breaks, which AppleScript leaves unescaped inside
+    strings; they can only appear inside strings, so they're escaped here.
+
+    Raises:
+        ValueError: If the output isn't a string or list of strings
+    """
+    source = text.strip().replace('\r', '\\r').replace('\n', '\\n')
+    if source.startswith('{') and source.endswith('}'):
+        source = '[' + source[1:-1] + ']'
+    try:
+        return ast.literal_eval(source)
+    except (ValueError, SyntaxError):
+        raise ValueError(f"Unexpected dialog result: {text.strip()}") from None
+
+
+def run_dialog(command, *args):
+    """
+    Run one of the handlers in the dialogs script.
+
+    Arguments are passed to the script's argv, so no AppleScript escaping
+    is needed for titles, messages, or paths. The result comes back in
+    AppleScript source form, so values containing tabs, quotes, or newlines
+    survive intact.
+
+    Returns:
+        The handler's result (a string or list of strings), or None if the
+        user cancelled
+
+    Raises:
+        RuntimeError: If osascript failed for any other reason (e.g. a
+            missing or broken dialogs script, or an error in the handler)
+        ValueError: If the handler's result couldn't be parsed
+    """
+    returncode, stdout, stderr = _run_command(
+        [OSASCRIPT, '-s', 's', str(DIALOGS_SCRIPT), command, *args]
+    )
+    if returncode != 0:
+        if APPLESCRIPT_USER_CANCELED in stderr:
+            return None
+        raise RuntimeError(f"Dialog '{command}' failed: {stderr.strip() or returncode}")
+    return _parse_applescript_result(stdout)
+
+
+def show_alert(title, message, buttons=["OK"]):
+    """
+    Show a macOS alert dialog and return the clicked button's name.
+
+    If the dialogs script itself fails, falls back to a plain alert (with
+    just an OK button) so the message still reaches the user.
+    """
+    try:
+        return run_dialog('alert', title, message, *buttons) or ""
+    except (RuntimeError, ValueError):
+        _run_command([OSASCRIPT, *FALLBACK_ALERT_SCRIPT, title, message], capture=False)
+        return ""
+
+
+def load_last_settings():
+    """
+    Load the settings saved by the previous dialog-driven launch.
+
+    Returns:
+        tuple: (output_dir, duration_str, interval_str), or None if there
+               are no usable saved settings
+    """
+    try:
+        settings = json.loads(SETTINGS_PATH.read_text())
+        output_dir = settings['output_dir']
+    except (OSError, ValueError, KeyError, TypeError):
         return None
-    output = result.stdout.strip()
-    if 'text returned:' in output:
-        return output.split('text returned:')[1].strip()
-    return default
-
-
-def get_output_directory():
-    """Ask user where to save output files."""
-    script = '''
-    set outputFolder to choose folder with prompt "Choose where to save the monitoring results:"
-    return POSIX path of outputFolder
-    '''
-    result = subprocess.run(
-        ['osascript', '-e', script],
-        capture_output=True,
-        text=True
+    if not output_dir:
+        return None
+    return (
+        str(output_dir),
+        str(settings.get('duration', "")),
+        str(settings.get('interval', "")),
+    )
+
+
+def save_last_settings(output_dir, duration_str, interval_str):
+    """Save the chosen settings so the next launch can offer them again."""
+    settings = {
+        'output_dir': output_dir,
+        'duration': duration_str,
+        'interval': interval_str,
+    }
+    _write_cache_file(SETTINGS_PATH, json.dumps(settings, indent=2))
+
+
+def run_dialog_flow(phocus_running, last_settings=None):
+    """
+    Run the launcher's whole dialog flow in a single osascript process.
+
+    Every osascript spawn pays process launch and AppleScript startup costs,
+    so the "Phocus not running" alert, folder picker, duration and interval
+    prompts, and the "Starting Monitor" confirmation all run as one script
+    that returns its answers as a list.
+
+    With last_settings, the script first offers to reuse them in a single
+    dialog and only shows the individual prompts if the user chooses to
+    change them.
+
+    Returns:
+        tuple: (output_dir, duration_str, interval_str), or None if cancelled
+
+    Raises:
+        RuntimeError: If the dialogs script failed
+        ValueError: If the dialogs' answers couldn't be read
+    """
+    args = ['yes' if phocus_running else 'no']
+    if last_settings is not None:
+        args += list(last_settings)
+    answers = run_dialog('configure', *args)
+    if answers is None:
+        return None
+    if not isinstance(answers, list) or len(answers) != 3:
+        raise ValueError(f"Unexpected dialog answers: {answers!r}")
+    return tuple(answers)
+
+
+def parse_launch_url(argv):
+    """
+    Look for a phocusmon://run URL among the launch arguments.
+
+    py2app's argv emulation delivers "open URL" Apple events as arguments.
+
+    Returns:
+        tuple: (output_dir, duration_str, interval_str), or None if the app
+               wasn't opened through a URL
+    """
+    for arg in argv[1:]:
+        url = urllib.parse.urlsplit(arg)
+        if url.scheme != URL_SCHEME or url.netloc != 'run':
+            continue
+        params = urllib.parse.parse_qs(url.query)
+        output_dir = params.get('out', [str(HOME_DIR / "Desktop")])[0]
+        duration = params.get('dur', [""])[0].strip()
+        if not duration.isdigit():
+            duration = ""  # Ignore an invalid duration - no dialog to re-ask
+        interval = params.get('interval', [""])[0].strip()
+        try:
+            if float(interval) <= 0:
+                interval = ""
+        except ValueError:
+            interval = ""  # Ignore an invalid interval, as for the duration
+        return (
+            output_dir,
+            duration,
+            interval,
+        )
+    return None
+
+
+def confirm_url_launch(answers):
+    """
+    Ask the user to confirm a monitor run requested by a phocusmon:// URL.
+
+    Any web page or app can open the URL, and the monitor may re-run itself
+    under sudo, so the settings are shown before anything starts, and
+    output folders outside the user's home folder are refused.
+
+    Args:
+        answers: (output_dir, duration_str, interval_str) from parse_launch_url
+
+    Returns:
+        tuple: The answers with output_dir resolved to an absolute path, or
+               None if the folder was refused or the user cancelled
+    """
+    output_dir, duration_str, interval_str = answers
+    output_path = Path(output_dir).expanduser().resolve()
+    if not output_path.is_relative_to(HOME_DIR.resolve()):
+        show_alert("Output Folder Not Allowed",
+                   f"A phocusmon:// link asked to save results to:\n{output_path}\n\n"
+                   "Links can only save results inside your home folder.")
+        return None
+
+    duration_label = f"{duration_str} seconds" if duration_str else "until you press Control+C"
+    interval_label = f"{interval_str} seconds" if interval_str else "2.0 seconds (default)"
+    button = show_alert(
+        "Start Monitoring?",
+        "A phocusmon:// link asked to start monitoring.\n\n"
+        f"Output folder: {output_path}\n"
+        f"Duration: {duration_label}\n"
+        f"Interval: {interval_label}\n\n"
+        "If your Mac needs the powermetrics fallback for GPU and Neural Engine "
+        "data, you'll be asked for your password in the Terminal window that opens.",
+        ["Cancel", "Start"],
     )
-    if result.returncode != 0:
-        return str(Path.home() / "Desktop")
-    return result.stdout.strip()
+    if button != "Start":
+        return None
+    return (str(output_path), duration_str, interval_str)
 
 
 def check_phocus_running():
-    """Check if Phocus is running."""
-    result = subprocess.run(['pgrep', '-x', 'Phocus'], capture_output=True)
-    return result.returncode == 0
+    """
+    Check if Phocus is running.
+
+    Asks LaunchServices in-process through PyObjC, which ships with py2app
+    builds; without it, falls back to pgrep. AppKit is imported here rather
+    than at module level, so launches that never check Phocus (a URL launch,
+    or one that trusts phocus_recently_seen()) don't pay to load the bridge
+    and the framework.
+    """
+    try:
+        from AppKit import NSWorkspace
+    except ImportError as e:
+        if getattr(sys, 'frozen', False):
+            # setup.py bundles AppKit, so this is a packaging bug - don't
+            # let the pgrep fallback hide it
+            print(f"Phocus Monitor: AppKit import failed in app bundle: {e}",
+                  file=sys.stderr)
+        NSWorkspace = None
+
+    if NSWorkspace is not None:
+        running_apps = NSWorkspace.sharedWorkspace().runningApplications()
+        return any(app.localizedName() == 'Phocus' for app in running_apps)
+
+    returncode, _, _ = _run_command([PGREP, '-x', 'Phocus'], capture=False)
+    return returncode == 0
+
+
+def phocus_recently_seen():
+    """
+    Check cheap signals that Phocus is running, before asking the system.
+
+    Returns True if we were launched by Phocus (LAUNCHED_BY_PHOCUS_ENV is
+    set) or Phocus was seen running within the last PHOCUS_SEEN_TTL seconds.
+    """
+    if os.environ.get(LAUNCHED_BY_PHOCUS_ENV):
+        return True
+    try:
+        return time.time() - PHOCUS_SEEN_CACHE.stat().st_mtime < PHOCUS_SEEN_TTL
+    except OSError:
+        return False
+
+
+def is_phocus_running():
+    """
+    Check whether Phocus is running, trusting recent evidence when available.
+
+    Falls through to check_phocus_running() and records a positive answer
+    so that a relaunch within PHOCUS_SEEN_TTL can skip the check.
+    """
+    if phocus_recently_seen():
+        return True
+    running = check_phocus_running()
+    if running:
+        _write_cache_file(PHOCUS_SEEN_CACHE, str(time.time()))
+    return running
+
+
+def _is_install_dir(candidate):
+    """Check whether a directory holds a set-up phocus-monitor installation."""
+    # One stat per file, no intermediate Path objects. The script sits at
+    # the top level, so a missing installation fails on the shallowest probe.
+    base = os.fspath(candidate)
+    try:
+        os.stat(os.path.join(base, "monitor_phocus.py"))
+        os.stat(os.path.join(base, ".venv", "bin", "python3"))
+    except OSError:
+        return False
+    return True
+
+
+def _read_cached_install_dir():
+    """Return the cached install directory if it is still valid, else None."""
+    try:
+        cached = INSTALL_DIR_CACHE.read_text().strip()
+    except OSError:
+        return None
+    if cached and _is_install_dir(Path(cached)):
+        return Path(cached)
+    return None
+
+
+def _write_cache_file(path, text):
+    """Write a cache file atomically (best effort - errors are ignored)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so a crash never leaves a partial file
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_text(text)
+        tmp_path.replace(path)
+    except OSError:
+        pass
+
+
+def _write_cached_install_dir(install_dir):
+    """Remember the install directory for the next launch."""
+    _write_cache_file(INSTALL_DIR_CACHE, str(install_dir))
+
+
+def _read_missing_paths():
+    """
+    Load the negative cache of candidate locations.
+
+    Returns:
+        dict mapping path string -> time it was found missing, with entries
+        older than MISSING_PATH_TTL dropped
+    """
+    try:
+        entries = json.loads(MISSING_PATHS_CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(entries, dict):
+        return {}
+    now = time.time()
+    return {
+        path: checked for path, checked in entries.items()
+        if isinstance(checked, (int, float)) and now - checked < MISSING_PATH_TTL
+    }
 
 
 def find_install_dir():
     """
     Find the phocus-monitor installation directory.
-    Checks several common locations.
-    """
-    candidates = [
-        DEFAULT_INSTALL_DIR,
-        Path.home() / "Downloads" / "phocus-monitor",
-        Path.home() / "Documents" / "phocus-monitor",
-        # iCloud Drive location
-        Path.home() / "Library" / "Mobile Documents" / "com~apple~CloudDocs" / "GitHub" / "phocus-monitor",
-    ]
+
+    Tries the location cached by the previous launch first, then checks
+    several common locations.
+    """
+    cached = _read_cached_install_dir()
+    if cached is not None:
+        return cached
+
+    candidates = list(INSTALL_DIR_CANDIDATES)
+
+    # iCloud Drive location - probing inside an unused iCloud Drive can stall
+    # while it materializes, so only look there if iCloud Drive is set up
+    if ICLOUD_DRIVE_DIR.is_dir():
+        candidates.append(ICLOUD_INSTALL_DIR)
 
     # If running as bundled app, check relative to bundle
     # The .app is at phocus-monitor/app/dist/Phocus Monitor.app
@@ -101,13 +518,35 @@ def find_install_dir():
         project_root = bundle_path.parent.parent.parent  # phocus-monitor
         candidates.insert(0, project_root)
 
-    for candidate in candidates:
-        venv_python = candidate / ".venv" / "bin" / "python3"
-        script = candidate / "monitor_phocus.py"
-        if venv_python.exists() and script.exists():
-            return candidate
+    missing = _read_missing_paths()
+    previously_missing = dict(missing)
+    found = None
+    skipped = []
 
-    return None
+    for candidate in candidates:
+        if str(candidate) in missing:
+            skipped.append(candidate)
+            continue
+        if _is_install_dir(candidate):
+            found = candidate
+            break
+        missing[str(candidate)] = time.time()
+
+    # Before giving up, re-check the locations skipped above - the user may
+    # have set up the installation there since they were last checked
+    if found is None:
+        for candidate in skipped:
+            if _is_install_dir(candidate):
+                found = candidate
+                break
+
+    if found is not None:
+        missing.pop(str(found), None)
+        _write_cached_install_dir(found)
+    if missing != previously_missing:
+        _write_cache_file(MISSING_PATHS_CACHE, json.dumps(missing))
+
+    return found
 
 
 def show_setup_instructions():
@@ -127,86 +566,95 @@ Then launch this app again."""
     show_alert("Setup Required", instructions)
 
 
+def launch_in_terminal(install_dir, command):
+    """
+    Run a command in a new Terminal window.
+
+    Fills in TERMINAL_COMMAND_TEMPLATE, writes it to a temporary .command
+    file, and opens that with Terminal - no AppleScript (and no Terminal or
+    System Events scripting) is involved.
+
+    Args:
+        install_dir: Directory to run the command from
+        command: Command and arguments as a list of strings
+    """
+    script = TERMINAL_COMMAND_TEMPLATE.substitute(
+        install_dir=shlex.quote(str(install_dir)),
+        command=' '.join(shlex.quote(arg) for arg in command),
+    )
+
+    with tempfile.NamedTemporaryFile('w', suffix='.command', prefix='phocus-monitor-',
+                                     delete=False) as f:
+        f.write(script)
+        command_path = f.name
+    os.chmod(command_path, 0o755)
+
+    _start_command([OPEN, '-a', 'Terminal', command_path])
+
+
 def main():
     """Main entry point for the app."""
 
-    # Find the installation directory
-    install_dir = find_install_dir()
+    # A phocusmon://run URL carries the options, so only a confirmation is needed
+    answers = parse_launch_url(sys.argv)
+
+    # Find the installation directory on a worker thread while checking
+    # whether Phocus is running - the two don't depend on each other.
+    # (The Phocus check stays on the main thread because it may use AppKit.)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        install_dir_future = pool.submit(find_install_dir)
+        phocus_running = answers is not None or is_phocus_running()
+        install_dir = install_dir_future.result()
 
     if install_dir is None:
         show_setup_instructions()
         sys.exit(0)
 
-    # Check if Phocus is running
-    if not check_phocus_running():
-        response = show_alert(
-            "Phocus Not Running",
-            "Phocus doesn't appear to be running. Please start Phocus first, then click OK to continue.",
-            ["OK", "Cancel"]
-        )
-        if "Cancel" in response:
+    if answers is not None:
+        # Opened through a URL - nothing starts without the user's say-so
+        answers = confirm_url_launch(answers)
+        if answers is None:
             sys.exit(0)
-
-        if not check_phocus_running():
-            show_alert(
-                "Phocus Still Not Running",
-                "Phocus still isn't running. The monitor will wait for it to start."
-            )
-
-    # Get output directory
-    output_dir = get_output_directory()
-
-    # Get duration (optional)
-    duration_str = show_input_dialog(
-        "How long should monitoring run?\\n(Enter seconds, or leave blank for manual stop with Control+C)",
-        ""
-    )
-
-    # Get sampling interval (optional)
-    interval_str = show_input_dialog(
-        "Sampling interval in seconds?\\n(Default is 2.0 — lower values give more detail but larger files)",
-        "2.0"
-    )
+    else:
+        # Run the whole dialog flow in one osascript process
+        try:
+            answers = run_dialog_flow(phocus_running, load_last_settings())
+        except (RuntimeError, ValueError) as e:
+            show_alert("Phocus Monitor", f"The settings dialogs failed, "
+                       f"so monitoring wasn't started.\n\n{e}")
+            sys.exit(1)
+        if answers is None:
+            # User cancelled at the "Phocus Not Running" alert
+            sys.exit(0)
+        save_last_settings(*answers)
+    output_dir, duration_str, interval_str = answers
+    output_dir = output_dir.rstrip('/')
 
     # Build paths
     venv_python = install_dir / ".venv" / "bin" / "python3"
     script_path = install_dir / "monitor_phocus.py"
 
-    # Build optional arguments
-    duration_arg = ""
-    if duration_str and duration_str.strip().isdigit():
-        duration_arg = f" -d {duration_str.strip()}"
+    # Build the monitor command line
+    command = [
+        str(venv_python), str(script_path),
+        # Only ask for a password if IOReport is unavailable
+        '--sudo-if-needed',
+        '-o', f"{output_dir}/",
+    ]
+
+    # Optional arguments (the dialog has already validated the duration)
+    if duration_str:
+        command += ['-d', duration_str]
 
-    interval_arg = ""
     if interval_str:
         try:
             interval = float(interval_str.strip())
             if interval > 0:
-                interval_arg = f" -i {interval}"
+                command += ['-i', str(interval)]
         except ValueError:
             pass  # Use default if invalid
 
-    # Show info
-    show_alert(
-        "Starting Monitor",
-        f"The monitor will now start.\\n\\nOutput will be saved to:\\n{output_dir}\\n\\nYou'll need to enter your password to allow hardware monitoring.\\n\\nA Terminal window will open - press Ctrl+C there when you want to stop.",
-        ["OK"]
-    )
-
-    # Launch in Terminal with sudo
-    # Use 'activate' and 'set frontmost' to ensure window comes to foreground
-    terminal_script = f'''
-    tell application "Terminal"
-        do script "cd '{install_dir}' && sudo '{venv_python}' '{script_path}' -o '{output_dir}/'{duration_arg}{interval_arg}; echo ''; echo 'Done! Press any key to close...'; read -n 1"
-        activate
-        set frontmost to true
-    end tell
-    tell application "System Events"
-        set frontmost of process "Terminal" to true
-    end tell
-    '''
-
-    subprocess.run(['osascript', '-e', terminal_script])
+    launch_in_terminal(install_dir, command)
 
 
 if __name__ == '__main__':
@@ -11,14 +11,49 @@ To build the app:
     python setup.py py2app
 
 The resulting .app will be in app/dist/
+
+Builds are semi-standalone: the app links against the Python framework it
+was built with instead of copying the whole framework (~50 MB) into the
+bundle, which keeps the app small and quick to open. The app therefore has
+to run on the Mac that built it (or one with the same Python installed at
+the same path) - which is how this project is meant to be used.
+
+To build an app you can give to someone else, bundle the full framework:
+    PHOCUS_STANDALONE=1 python setup.py py2app
+
+For development, build an alias app that runs launcher.py in place:
+    PHOCUS_DEV=1 python setup.py py2app
+
+The launcher's dialogs live in dialogs.applescript. py2app builds compile it
+with osacompile and bundle the resulting dialogs.scpt into the app's
+Resources, so osascript doesn't re-parse AppleScript source on every launch.
 """
 
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 from setuptools import setup
 
 APP = ['launcher.py']
 
+DIALOGS_SOURCE = Path('dialogs.applescript')
+DIALOGS_COMPILED = Path('build') / 'dialogs.scpt'
+
+
+def compile_dialogs():
+    """Pre-compile the launcher's AppleScript dialogs with osacompile."""
+    DIALOGS_COMPILED.parent.mkdir(parents=True, exist_ok=True)
+    subprocess.run(
+        ['osacompile', '-o', str(DIALOGS_COMPILED), str(DIALOGS_SOURCE)],
+        check=True
+    )
+
+
 OPTIONS = {
-    'argv_emulation': False,
+    # Turns "open URL" Apple events into sys.argv entries for phocusmon:// URLs
+    'argv_emulation': True,
     'plist': {
         'CFBundleName': 'Phocus Monitor',
         'CFBundleDisplayName': 'Phocus Monitor',
@@ -28,12 +63,28 @@ OPTIONS = {
         'NSHumanReadableCopyright': '© 2025 Konrad Michels',
         'NSHighResolutionCapable': True,
         'LSMinimumSystemVersion': '11.0',  # Big Sur minimum for Apple Silicon
-        'NSAppleEventsUsageDescription': 'Phocus Monitor needs to run AppleScript for admin privileges and dialogs.',
+        'CFBundleURLTypes': [
+            {
+                'CFBundleURLName': 'com.tonalphoto.phocusmonitor',
+                'CFBundleURLSchemes': ['phocusmon'],
+            },
+        ],
+        'NSAppleEventsUsageDescription': 'Phocus Monitor uses AppleScript to show its dialogs.',
     },
-    # Minimal includes - launcher only uses stdlib
+    # Strip docstrings and asserts from the bundled bytecode
+    'optimize': 2,
+    # Minimal includes - launcher uses stdlib (found automatically) plus
+    # PyObjC's AppKit for checking whether Phocus is running without pgrep
     'includes': [
-        'subprocess',
+        'AppKit',
+        'Foundation',
     ],
+    # Everything neither the launcher nor PyObjC imports stays out of the
+    # bundle, so there is less to read from disk on every launch. Checked
+    # against pyobjc-core/pyobjc-framework-Cocoa 10.3: objc imports
+    # xml.etree.ElementTree (objc/_bridgesupport.py) at import time, so
+    # xml must stay; unittest is only used by PyObjCTools.TestSupport.
+    # (urllib is kept for phocusmon:// URL parsing.)
     'excludes': [
         'tkinter',
         'test',
@@ -42,9 +93,40 @@ OPTIONS = {
         'matplotlib',  # Not needed in launcher
         'numpy',       # Not needed in launcher
         'PIL',
+        'ssl',
+        'email',
+        'xmlrpc',
+        'logging.config',
+        'pydoc',
+        'pydoc_data',
+        'distutils',
+        'lib2to3',
+        'pkg_resources',
+        'setuptools',
+        'html',
+        'http',
+        'difflib',
+        'doctest',
     ],
 }
 
+if os.environ.get('PHOCUS_DEV') == '1':
+    # Development: symlink to the source instead of copying anything
+    OPTIONS['alias'] = True
+elif os.environ.get('PHOCUS_STANDALONE') == '1':
+    # Distribution: py2app's default full build, which copies the Python
+    # framework into the bundle so the app runs on any Mac
+    pass
+else:
+    # Release: reuse the installed Python framework; bundle only what the
+    # launcher imports from outside the standard library
+    OPTIONS['semi_standalone'] = True
+    OPTIONS['site_packages'] = False
+
+if 'py2app' in sys.argv:
+    compile_dialogs()
+    OPTIONS['resources'] = [str(DIALOGS_COMPILED)]
+
 setup(
     name='Phocus Monitor',
     app=APP,
@@ -20,10 +20,13 @@ Requirements:
   - macOS on Apple Silicon (M1/M2/M3/M4 series)
   - Python 3.9+
   - psutil, matplotlib (pip install psutil matplotlib)
-  - sudo access for GPU/ANE metrics via powermetrics
+  - GPU/ANE metrics are read from IOReport; sudo is only needed when
+    IOReport is unavailable and powermetrics is used instead
+    (--sudo-if-needed re-runs the script under sudo in that case)
 
 Usage:
-  sudo python3 monitor_phocus.py [--duration SECONDS] [--interval SECONDS] [--output PATH]
+  python3 monitor_phocus.py [--duration SECONDS] [--interval SECONDS] [--output PATH]
+                            [--max-samples N] [--sudo-if-needed]
 
 Controls during recording:
   - Press Enter to add an annotation at the current timestamp
@@ -44,18 +47,26 @@ Author: Konrad Michels (tonalphoto.com)
 License: MIT
 """
 
+import ctypes
+import gc
+import queue
 import subprocess
 import time
 import argparse
+import atexit
 import re
 import sys
 import os
 import signal
+import stat
 import threading
-import select
+import selectors
 import plistlib
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
+from typing import NamedTuple
 
 # =============================================================================
 # Constants
@@ -64,14 +75,67 @@ from pathlib import Path
 VERSION = "2.5.1"
 DEFAULT_INTERVAL = 2.0          # Sampling interval in seconds
 DEFAULT_ANE_CORES = 16          # All Apple Silicon chips have 16-core ANE
-POWERMETRICS_TIMEOUT = 10       # Timeout for powermetrics calls (seconds)
-POWERMETRICS_SAMPLE_MS = 100    # powermetrics sampling interval (milliseconds)
+POWERMETRICS_TIMEOUT = 10       # Max wait for powermetrics' first sample (seconds)
 MEMORY_PRESSURE_TIMEOUT = 2     # Timeout for memory_pressure command (seconds)
 SYSTEM_PROFILER_TIMEOUT = 10    # Timeout for system_profiler command (seconds)
+CHILD_REFRESH_SAMPLES = 10      # Re-scan Phocus' child processes every N samples
+PRESSURE_REFRESH_INTERVAL = 5.0 # Re-read memory pressure at most this often (seconds)
+PHOCUS_SEARCH_INTERVAL = 2.0    # Min time between process-table scans while Phocus isn't running (seconds)
+CSV_FLUSH_ROWS = 30             # Flush the CSV file to disk every N rows
+INITIAL_CAPACITY = 4096         # Samples preallocated per metric (doubles when full)
+PLOT_MAX_POINTS = 8400          # Points plotted per series (~2 per pixel of the hi-res PNG)
+DOWNSAMPLE_MINMAX_RATIO = 4     # MinMax preselection keeps this many candidates per output point
+PNG_COMPRESS_LEVEL = 1          # zlib level for the PNG files (fast; default 6 is ~3x slower)
+GPU_PERCENT_SCALE = 10          # gpu_percent is stored in tenths of a percent
+UINT16_MAX = 65535              # Ceiling for gpu_percent, stored as uint16 tenths of a %
+
+# Single-line status shown while recording; the ANE variant is used only
+# while the Neural Engine is active, to save display space
+STATUS_LINE = ("\r[{elapsed:5.1f}m] Mem:{mem:5.1f}GB | GPU:{gpu:5.1f}% | "
+               "CPU:{cpu:5.0f}% | Pwr:{gpu_pwr:4.1f}W | #{count}")
+STATUS_LINE_ANE = ("\r[{elapsed:5.1f}m] Mem:{mem:5.1f}GB | GPU:{gpu:5.1f}% | "
+                   "CPU:{cpu:5.0f}% | Pwr:{gpu_pwr:4.1f}W | ANE:{ane_pwr:.1f}W | #{count}")
+
+# Per-sample data arrays on PhocusMonitor, all indexed by sample number
+SERIES_NAMES = ('timestamps', 'memory_mb', 'gpu_percent', 'gpu_power_mw',
+                'ane_power_mw', 'cpu_percent', 'swap_used_mb', 'memory_pressure')
 
 # Default Phocus application path
 PHOCUS_APP_PATH = "/Applications/Phocus.app"
 
+# Patterns for parsing system_profiler and ioreg output (compiled once)
+# One alternation covers every system_profiler line we need, e.g.
+#   "Chip: Apple M4 Pro"
+#   "Total Number of Cores: 14 (10 performance and 4 efficiency)"
+#   "Memory: 48 GB"
+RE_HARDWARE_OVERVIEW = re.compile(
+    r'^\s*(?:'
+    r'Chip:[ \t]*(?P<chip>.+)'
+    r'|Total Number of Cores:\s*(?P<cpu_cores>\d+)'
+    r'(?:\s*\((?P<cpu_p_cores>\d+)\s*performance\s+and\s+(?P<cpu_e_cores>\d+)\s*efficiency\))?'
+    r'|Memory:\s*(?P<ram_gb>\d+)\s*GB'
+    r')',
+    re.MULTILINE
+)
+RE_GPU_CORE_COUNT = re.compile(r'"gpu-core-count"\s*=\s*(\d+)')
+
+# IOReport is the private library powermetrics itself reads GPU/ANE counters
+# from. Reading it directly needs no subprocess and no root access.
+IOREPORT_LIB_PATH = "/usr/lib/libIOReport.dylib"
+CORE_FOUNDATION_PATH = "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+IOKIT_PATH = "/System/Library/Frameworks/IOKit.framework/IOKit"
+CF_STRING_ENCODING_UTF8 = 0x08000100   # kCFStringEncodingUTF8
+CF_NUMBER_SINT32_TYPE = 3              # kCFNumberSInt32Type
+
+# libc, for reading sysctl values without spawning a process
+LIBC_PATH = "/usr/lib/libc.dylib"
+
+# Used by --sudo-if-needed to re-run under root for the powermetrics fallback
+SUDO_PATH = "/usr/bin/sudo"
+
+# kern.memorystatus_vm_pressure_level -> 0=normal, 1=warning, 2=critical
+VM_PRESSURE_LEVELS = {1: 0, 2: 1, 4: 2}
+
 # =============================================================================
 # Dependency checks
 # =============================================================================
@@ -83,20 +147,540 @@ except ImportError:
     print("Set up the virtual environment first:")
     print("  python3 -m venv .venv")
     print("  .venv/bin/pip install -r requirements.txt")
-    print("Then run with: sudo .venv/bin/python3 monitor_phocus.py")
+    print("Then run with: .venv/bin/python3 monitor_phocus.py")
     sys.exit(1)
 
 try:
+    import matplotlib
+    # Only PNG files are produced, so skip GUI backend (macOSX) start-up
+    matplotlib.use('Agg')
     import matplotlib.pyplot as plt
     import matplotlib.gridspec as gridspec
+    from matplotlib.collections import LineCollection
+    import numpy as np  # Installed with matplotlib
+    from PIL import Image  # Installed with matplotlib
 except ImportError:
     print("Error: matplotlib not installed.")
     print("Set up the virtual environment first:")
     print("  python3 -m venv .venv")
     print("  .venv/bin/pip install -r requirements.txt")
-    print("Then run with: sudo .venv/bin/python3 monitor_phocus.py")
+    print("Then run with: .venv/bin/python3 monitor_phocus.py")
     sys.exit(1)
 
+# Seaborn style for a clean look - applied once here rather than per plot
+try:
+    plt.style.use('seaborn-v0_8-whitegrid')
+except OSError:
+    # Fallback if seaborn style not available
+    plt.style.use('ggplot')
+
+
+# =============================================================================
+# sysctl and IOKit access
+# =============================================================================
+
+try:
+    LIBC = ctypes.CDLL(LIBC_PATH, use_errno=True)
+except OSError:
+    # Not macOS - callers fall back to command-line tools
+    LIBC = None
+else:
+    # int sysctlbyname(const char *name, void *oldp, size_t *oldlenp,
+    #                  void *newp, size_t newlen)
+    LIBC.sysctlbyname.restype = ctypes.c_int
+    LIBC.sysctlbyname.argtypes = [ctypes.c_char_p, ctypes.c_void_p,
+                                  ctypes.POINTER(ctypes.c_size_t),
+                                  ctypes.c_void_p, ctypes.c_size_t]
+
+
+def _sysctl_bytes(name):
+    """
+    Read a raw sysctl value by name (like `sysctl -n name`).
+
+    Args:
+        name: sysctl name, e.g. "kern.memorystatus_vm_pressure_level"
+
+    Returns:
+        bytes value
+
+    Raises:
+        OSError: if libc is unavailable or the sysctl call fails
+    """
+    if LIBC is None:
+        raise OSError("sysctl unavailable")
+    encoded = name.encode()
+
+    # First call gets the size, second call reads the value
+    size = ctypes.c_size_t(0)
+    if LIBC.sysctlbyname(encoded, None, ctypes.byref(size), None, 0) == 0:
+        buf = ctypes.create_string_buffer(size.value)
+        if LIBC.sysctlbyname(encoded, buf, ctypes.byref(size), None, 0) == 0:
+            return buf.raw[:size.value]
+    errno = ctypes.get_errno()
+    raise OSError(errno, f"sysctl {name}: {os.strerror(errno)}")
+
+
+def _sysctl_int(name):
+    """Read an integer sysctl value (any width). Raises OSError on failure."""
+    return int.from_bytes(_sysctl_bytes(name), sys.byteorder)
+
+
+def _sysctl_str(name):
+    """Read a string sysctl value. Raises OSError on failure."""
+    return _sysctl_bytes(name).rstrip(b'\0').decode('utf-8', errors='replace')
+
+
+def _gpu_core_count():
+    """
+    Read the GPU core count from the AGXAccelerator service in the IOKit registry.
+
+    Returns:
+        int: Number of GPU cores
+
+    Raises:
+        OSError: if IOKit is unavailable or the property can't be read
+    """
+    iokit = ctypes.CDLL(IOKIT_PATH)
+    cf = ctypes.CDLL(CORE_FOUNDATION_PATH)
+
+    iokit.IOServiceMatching.restype = ctypes.c_void_p
+    iokit.IOServiceMatching.argtypes = [ctypes.c_char_p]
+    iokit.IOServiceGetMatchingService.restype = ctypes.c_uint32
+    iokit.IOServiceGetMatchingService.argtypes = [ctypes.c_uint32, ctypes.c_void_p]
+    iokit.IORegistryEntryCreateCFProperty.restype = ctypes.c_void_p
+    iokit.IORegistryEntryCreateCFProperty.argtypes = [
+        ctypes.c_uint32, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint32]
+    iokit.IOObjectRelease.argtypes = [ctypes.c_uint32]
+    cf.CFStringCreateWithCString.restype = ctypes.c_void_p
+    cf.CFStringCreateWithCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint32]
+    cf.CFNumberGetValue.restype = ctypes.c_bool
+    cf.CFNumberGetValue.argtypes = [ctypes.c_void_p, ctypes.c_long, ctypes.c_void_p]
+    cf.CFRelease.argtypes = [ctypes.c_void_p]
+
+    # Port 0 = kIOMainPortDefault; the matching dict is consumed by the call
+    service = iokit.IOServiceGetMatchingService(0, iokit.IOServiceMatching(b"AGXAccelerator"))
+    if not service:
+        raise OSError("AGXAccelerator service not found")
+
+    try:
+        key = cf.CFStringCreateWithCString(None, b"gpu-core-count", CF_STRING_ENCODING_UTF8)
+        prop = iokit.IORegistryEntryCreateCFProperty(service, key, None, 0)
+        cf.CFRelease(key)
+        if not prop:
+            raise OSError("gpu-core-count property not found")
+        value = ctypes.c_int32(0)
+        ok = cf.CFNumberGetValue(prop, CF_NUMBER_SINT32_TYPE, ctypes.byref(value))
+        cf.CFRelease(prop)
+        if not ok:
+            raise OSError("gpu-core-count is not a number")
+        return value.value
+    finally:
+        iokit.IOObjectRelease(service)
+
+
+# =============================================================================
+# System information
+# =============================================================================
+
+class SystemInfo(NamedTuple):
+    """Apple Silicon hardware summary, gathered once at startup."""
+    chip: str
+    cpu_cores: int
+    cpu_p_cores: int
+    cpu_e_cores: int
+    ram_gb: int
+    gpu_cores: int
+    ane_cores: int
+
+
+@lru_cache(maxsize=1)
+def _system_info():
+    """
+    Gather Apple Silicon system information from sysctl and IOKit.
+
+    Falls back to system_profiler and ioreg if those can't be read. The
+    hardware can't change while we run, so the result is cached for the
+    life of the process.
+
+    Returns:
+        SystemInfo record (immutable, so the cached value can be shared)
+    """
+    info = {
+        'chip': 'Unknown',
+        'cpu_cores': 0,
+        'cpu_p_cores': 0,
+        'cpu_e_cores': 0,
+        'ram_gb': 0,
+        'gpu_cores': 0,
+        'ane_cores': DEFAULT_ANE_CORES  # All Apple Silicon has 16-core ANE
+    }
+
+    # Chip name, CPU cores, and RAM from sysctl - a handful of syscalls,
+    # where system_profiler takes seconds
+    try:
+        info['chip'] = _sysctl_str('machdep.cpu.brand_string') or 'Unknown'
+        info['cpu_cores'] = _sysctl_int('hw.physicalcpu')
+        info['cpu_p_cores'] = _sysctl_int('hw.perflevel0.physicalcpu')
+        info['cpu_e_cores'] = _sysctl_int('hw.perflevel1.physicalcpu')
+        info['ram_gb'] = _sysctl_int('hw.memsize') // (1024 ** 3)
+    except OSError:
+        _read_system_profiler(info)
+
+    # GPU core count from the IOKit registry (separate try block - don't
+    # fail if this fails), falling back to searching ioreg's output
+    try:
+        info['gpu_cores'] = _gpu_core_count()
+    except OSError:
+        _read_ioreg_gpu_cores(info)
+
+    return SystemInfo(**info)
+
+
+def _read_system_profiler(info):
+    """
+    Fill in chip name, CPU cores, and RAM from system_profiler (slow fallback).
+
+    Args:
+        info: System info dict to update in place
+    """
+    try:
+        result = subprocess.run(
+            ['system_profiler', 'SPHardwareDataType'],
+            capture_output=True, text=True, timeout=SYSTEM_PROFILER_TIMEOUT
+        )
+
+        # Scan the whole output in one pass instead of line by line
+        for match in RE_HARDWARE_OVERVIEW.finditer(result.stdout):
+            if match.group('chip'):
+                info['chip'] = match.group('chip').strip()
+            elif match.group('cpu_cores'):
+                info['cpu_cores'] = int(match.group('cpu_cores'))
+                # P/E breakdown is only present on Apple Silicon
+                if match.group('cpu_p_cores'):
+                    info['cpu_p_cores'] = int(match.group('cpu_p_cores'))
+                    info['cpu_e_cores'] = int(match.group('cpu_e_cores'))
+            elif match.group('ram_gb'):
+                info['ram_gb'] = int(match.group('ram_gb'))
+
+            # Stop once everything we need has been found
+            if info['chip'] != 'Unknown' and info['cpu_cores'] and info['ram_gb']:
+                break
+
+    except subprocess.TimeoutExpired:
+        print("Warning: system_profiler timed out")
+    except subprocess.SubprocessError as e:
+        print(f"Warning: Could not run system_profiler: {e}")
+    except (ValueError, AttributeError) as e:
+        print(f"Warning: Error parsing system_profiler output: {e}")
+
+
+def _read_ioreg_gpu_cores(info):
+    """
+    Fill in the GPU core count from the AGXAccelerator ioreg entry (fallback).
+
+    Args:
+        info: System info dict to update in place
+    """
+    try:
+        # Use encoding='utf-8' with errors='replace' because ioreg can output
+        # non-UTF-8 bytes (e.g., device names with special characters)
+        # -r -c: only the AGXAccelerator entry, -d 1: without its children -
+        # a few KB instead of dumping the whole registry with -l
+        gpu_result = subprocess.run(
+            ['ioreg', '-r', '-d', '1', '-c', 'AGXAccelerator'],
+            capture_output=True, timeout=SYSTEM_PROFILER_TIMEOUT,
+            encoding='utf-8', errors='replace'
+        )
+
+        match = RE_GPU_CORE_COUNT.search(gpu_result.stdout)
+        if match:
+            info['gpu_cores'] = int(match.group(1))
+
+    except subprocess.TimeoutExpired:
+        print("Warning: ioreg timed out (GPU core count unavailable)")
+    except subprocess.SubprocessError as e:
+        print(f"Warning: Could not get GPU core count: {e}")
+    except UnicodeDecodeError:
+        # Shouldn't happen with errors='replace', but just in case
+        pass
+
+
+# =============================================================================
+# Plot downsampling
+# =============================================================================
+
+def _downsample(x, y, n_out=PLOT_MAX_POINTS):
+    """
+    Reduce a time series to at most n_out points for plotting (MinMaxLTTB).
+
+    A MinMax pass first keeps each bucket's lowest and highest sample, so
+    spikes survive; Largest-Triangle-Three-Buckets then picks the n_out
+    points from those candidates that best preserve the line's shape.
+
+    Args:
+        x: Sorted x values (NumPy array)
+        y: y values (NumPy array, same length)
+        n_out: Maximum number of points to return
+
+    Returns:
+        tuple: (x, y) arrays, unchanged if already short enough
+    """
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    # MinMax preselection: min and max of equal-width buckets, always
+    # keeping the first point and any leftover points at the end
+    candidates = np.arange(n)
+    n_buckets = n_out * DOWNSAMPLE_MINMAX_RATIO // 2
+    width = (n - 2) // n_buckets
+    if width > 1:
+        body = y[1:1 + width * n_buckets].reshape(n_buckets, width)
+        offsets = 1 + np.arange(n_buckets) * width
+        candidates = np.unique(np.concatenate([
+            [0],
+            offsets + body.argmin(axis=1),
+            offsets + body.argmax(axis=1),
+            np.arange(1 + width * n_buckets, n),
+        ]))
+    cx = x[candidates].astype(np.float64)
+    cy = y[candidates].astype(np.float64)
+
+    # LTTB: from each bucket keep the point forming the largest triangle
+    # with the previously kept point and the next bucket's average
+    m = len(candidates)
+    every = (m - 2) / (n_out - 2)
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0] = 0
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, m)
+        avg_x = cx[end:next_end].mean()
+        avg_y = cy[end:next_end].mean()
+        area = np.abs((cx[a] - avg_x) * (cy[start:end] - cy[a]) -
+                      (cx[a] - cx[start:end]) * (avg_y - cy[a]))
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+    selected[-1] = m - 1
+
+    keep = candidates[selected]
+    return x[keep], y[keep]
+
+
+# =============================================================================
+# IOReport GPU/ANE sampler
+# =============================================================================
+
+class IOReportSampler:
+    """
+    Reads GPU residency and GPU/ANE energy counters from IOReport via ctypes.
+
+    Subscribes once to the "Energy Model" and "GPU Stats" channel groups;
+    each read() takes a new sample and diffs it against the previous one,
+    so the returned figures cover the time since the last read.
+
+    Raises OSError on construction if IOReport isn't available (e.g. not on
+    Apple Silicon), so the caller can fall back to powermetrics.
+    """
+
+    # Energy counters are reported in whatever unit the channel declares
+    ENERGY_UNITS_TO_MJ = {'mJ': 1.0, 'uJ': 1e-3, 'nJ': 1e-6}
+
+    # GPU performance states that don't count as "active"
+    GPU_IDLE_STATES = ('OFF', 'IDLE', 'DOWN')
+
+    def __init__(self):
+        cf = ctypes.CDLL(CORE_FOUNDATION_PATH)
+        ior = ctypes.CDLL(IOREPORT_LIB_PATH)
+
+        # CoreFoundation helpers - every CF object is passed as an opaque pointer
+        cf.CFStringCreateWithCString.restype = ctypes.c_void_p
+        cf.CFStringCreateWithCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint32]
+        cf.CFStringGetCString.restype = ctypes.c_bool
+        cf.CFStringGetCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_long, ctypes.c_uint32]
+        cf.CFDictionaryGetValue.restype = ctypes.c_void_p
+        cf.CFDictionaryGetValue.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        cf.CFDictionaryGetCount.restype = ctypes.c_long
+        cf.CFDictionaryGetCount.argtypes = [ctypes.c_void_p]
+        cf.CFDictionaryCreateMutableCopy.restype = ctypes.c_void_p
+        cf.CFDictionaryCreateMutableCopy.argtypes = [ctypes.c_void_p, ctypes.c_long, ctypes.c_void_p]
+        cf.CFArrayGetCount.restype = ctypes.c_long
+        cf.CFArrayGetCount.argtypes = [ctypes.c_void_p]
+        cf.CFArrayGetValueAtIndex.restype = ctypes.c_void_p
+        cf.CFArrayGetValueAtIndex.argtypes = [ctypes.c_void_p, ctypes.c_long]
+        cf.CFRelease.restype = None
+        cf.CFRelease.argtypes = [ctypes.c_void_p]
+
+        # IOReport subscription and sampling
+        ior.IOReportCopyChannelsInGroup.restype = ctypes.c_void_p
+        ior.IOReportCopyChannelsInGroup.argtypes = [
+            ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint64, ctypes.c_uint64, ctypes.c_uint64]
+        ior.IOReportMergeChannels.restype = None
+        ior.IOReportMergeChannels.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p]
+        ior.IOReportCreateSubscription.restype = ctypes.c_void_p
+        ior.IOReportCreateSubscription.argtypes = [
+            ctypes.c_void_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p),
+            ctypes.c_uint64, ctypes.c_void_p]
+        ior.IOReportCreateSamples.restype = ctypes.c_void_p
+        ior.IOReportCreateSamples.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p]
+        ior.IOReportCreateSamplesDelta.restype = ctypes.c_void_p
+        ior.IOReportCreateSamplesDelta.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p]
+
+        # Per-channel accessors
+        for name in ('IOReportChannelGetGroup', 'IOReportChannelGetSubGroup',
+                     'IOReportChannelGetChannelName', 'IOReportChannelGetUnitLabel'):
+            getattr(ior, name).restype = ctypes.c_void_p
+            getattr(ior, name).argtypes = [ctypes.c_void_p]
+        ior.IOReportSimpleGetIntegerValue.restype = ctypes.c_int64
+        ior.IOReportSimpleGetIntegerValue.argtypes = [ctypes.c_void_p, ctypes.c_int32]
+        ior.IOReportStateGetCount.restype = ctypes.c_int32
+        ior.IOReportStateGetCount.argtypes = [ctypes.c_void_p]
+        ior.IOReportStateGetNameForIndex.restype = ctypes.c_void_p
+        ior.IOReportStateGetNameForIndex.argtypes = [ctypes.c_void_p, ctypes.c_int32]
+        ior.IOReportStateGetResidency.restype = ctypes.c_int64
+        ior.IOReportStateGetResidency.argtypes = [ctypes.c_void_p, ctypes.c_int32]
+
+        self._cf = cf
+        self._ior = ior
+        self._channels_key = self._cfstr("IOReportChannels")
+
+        # Subscribe once to both channel groups
+        channels = ior.IOReportCopyChannelsInGroup(self._cfstr("Energy Model"), None, 0, 0, 0)
+        gpu_channels = ior.IOReportCopyChannelsInGroup(self._cfstr("GPU Stats"), None, 0, 0, 0)
+        if not channels or not gpu_channels:
+            raise OSError("IOReport channel groups not found")
+        ior.IOReportMergeChannels(channels, gpu_channels, None)
+        cf.CFRelease(gpu_channels)
+
+        self._channels = cf.CFDictionaryCreateMutableCopy(None, cf.CFDictionaryGetCount(channels), channels)
+        cf.CFRelease(channels)
+        self._subscribed = ctypes.c_void_p()
+        self._subscription = ior.IOReportCreateSubscription(
+            None, self._channels, ctypes.byref(self._subscribed), 0, None)
+        if not self._subscription:
+            raise OSError("IOReport subscription failed")
+
+        # Baseline sample for the first delta
+        self._prev_sample = self._take_sample()
+        self._prev_time = time.monotonic()
+
+    def _cfstr(self, text):
+        """Create a CFString from a Python string (kept for the process lifetime)."""
+        return self._cf.CFStringCreateWithCString(None, text.encode('utf-8'), CF_STRING_ENCODING_UTF8)
+
+    def _pystr(self, cfstr):
+        """Convert a CFString to a Python string ('' for NULL)."""
+        if not cfstr:
+            return ""
+        buf = ctypes.create_string_buffer(256)
+        if self._cf.CFStringGetCString(cfstr, buf, len(buf), CF_STRING_ENCODING_UTF8):
+            return buf.value.decode('utf-8', errors='replace')
+        return ""
+
+    def _take_sample(self):
+        """Take a raw IOReport sample of all subscribed channels."""
+        sample = self._ior.IOReportCreateSamples(self._subscription, self._subscribed, None)
+        if not sample:
+            raise OSError("IOReport sample failed")
+        return sample
+
+    def read(self):
+        """
+        Read GPU and ANE activity since the previous call.
+
+        Returns:
+            tuple: (gpu_active_percent, gpu_power_mw, ane_power_mw)
+        """
+        cf, ior = self._cf, self._ior
+
+        sample = self._take_sample()
+        now = time.monotonic()
+        delta = ior.IOReportCreateSamplesDelta(self._prev_sample, sample, None)
+        cf.CFRelease(self._prev_sample)
+        self._prev_sample = sample
+        elapsed = max(now - self._prev_time, 1e-3)
+        self._prev_time = now
+        if not delta:
+            raise OSError("IOReport delta failed")
+
+        gpu_energy_mj = 0.0
+        ane_energy_mj = 0.0
+        gpu_active = 0
+        gpu_total = 0
+
+        try:
+            channels = cf.CFDictionaryGetValue(delta, self._channels_key)
+            for i in range(cf.CFArrayGetCount(channels) if channels else 0):
+                channel = cf.CFArrayGetValueAtIndex(channels, i)
+                group = self._pystr(ior.IOReportChannelGetGroup(channel))
+                name = self._pystr(ior.IOReportChannelGetChannelName(channel))
+
+                if group == "Energy Model" and (name == "GPU Energy" or name.startswith("ANE")):
+                    unit = self._pystr(ior.IOReportChannelGetUnitLabel(channel)).strip()
+                    energy = ior.IOReportSimpleGetIntegerValue(channel, 0)
+                    energy *= self.ENERGY_UNITS_TO_MJ.get(unit, 1e-6)
+                    if name == "GPU Energy":
+                        gpu_energy_mj += energy
+                    else:
+                        ane_energy_mj += energy
+
+                # GPU active residency: time spent in any performance state
+                # other than off/idle, as a share of all time
+                elif (group == "GPU Stats" and name == "GPUPH" and
+                      self._pystr(ior.IOReportChannelGetSubGroup(channel)) == "GPU Performance States"):
+                    for state in range(ior.IOReportStateGetCount(channel)):
+                        residency = ior.IOReportStateGetResidency(channel, state)
+                        gpu_total += residency
+                        if self._pystr(ior.IOReportStateGetNameForIndex(channel, state)) not in self.GPU_IDLE_STATES:
+                            gpu_active += residency
+        finally:
+            cf.CFRelease(delta)
+
+        gpu_percent = 100.0 * gpu_active / gpu_total if gpu_total else 0.0
+        # mJ per second = mW
+        return gpu_percent, gpu_energy_mj / elapsed, ane_energy_mj / elapsed
+
+
+def _ioreport_available():
+    """
+    Check whether GPU/ANE counters can be read without root.
+
+    Returns:
+        bool: True if an IOReportSampler can be created, False if the
+              script would have to fall back to powermetrics (root only)
+    """
+    try:
+        IOReportSampler()
+    except (OSError, AttributeError):
+        return False
+    return True
+
+
+# =============================================================================
+# Output paths
+# =============================================================================
+
+def _probe_path(path):
+    """
+    Check whether a path exists and is a directory with a single stat call.
+
+    Like Path.exists(), any OSError (e.g. a symlink loop or an unreadable
+    parent directory) counts as "doesn't exist".
+
+    Args:
+        path: Path to check
+
+    Returns:
+        tuple: (exists, is_dir)
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False, False
+    return True, stat.S_ISDIR(st.st_mode)
+
 
 class PhocusMonitor:
     """
@@ -106,7 +690,7 @@ class PhocusMonitor:
     supports interactive annotations, and generates graphs/CSV output.
     """
 
-    def __init__(self, interval=DEFAULT_INTERVAL, output_base=None):
+    def __init__(self, interval=DEFAULT_INTERVAL, output_base=None, max_samples=None):
         """
         Initialize the Phocus monitor.
 
@@ -116,30 +700,70 @@ class PhocusMonitor:
                 - None: Uses default timestamped name in current directory
                 - Directory path: Uses default name in specified directory
                 - Full path with filename: Uses specified path/name
+            max_samples: Keep only the most recent this many samples in a
+                fixed-size ring buffer (default: None = keep everything)
         """
         self.interval = interval
         self.output_base = self._resolve_output_path(output_base)
-
-        # Data storage - all lists grow together, indexed by sample number
-        self.timestamps = []        # datetime objects for each sample
-        self.memory_mb = []         # Phocus memory usage in MB
-        self.gpu_percent = []       # System-wide GPU utilization %
-        self.gpu_power_mw = []      # System-wide GPU power in milliwatts
-        self.ane_power_mw = []      # System-wide ANE power in milliwatts
-        self.cpu_percent = []       # Phocus CPU usage (100% = 1 core)
-        self.swap_used_mb = []      # System swap usage in MB
-        self.memory_pressure = []   # Memory pressure: 0=normal, 1=warn, 2=critical
-
-        # Annotations: list of (timestamp_index, label) tuples
+        self.max_samples = max_samples
+
+        # Data storage - preallocated NumPy arrays written together (see
+        # _store_sample). sample_count is the total number of samples taken;
+        # sample i lives at index i % capacity. Without max_samples the
+        # arrays grow so nothing is overwritten; with it they're a ring
+        # buffer holding the latest max_samples. Use _series() to read.
+        # Metrics with a known small range are stored as compact integers
+        # (the CSV gets the full-precision values).
+        capacity = max_samples or INITIAL_CAPACITY
+        self.sample_count = 0
+        self.timestamps = np.empty(capacity, dtype='datetime64[us]')  # Local time of each sample
+        self.memory_mb = np.empty(capacity, dtype=np.float32)        # Phocus memory usage in MB
+        self.gpu_percent = np.empty(capacity, dtype=np.uint16)       # System-wide GPU utilization, 0.1% units
+        self.gpu_power_mw = np.empty(capacity, dtype=np.float32)     # System-wide GPU power in milliwatts
+        self.ane_power_mw = np.empty(capacity, dtype=np.float32)     # System-wide ANE power in milliwatts
+        self.cpu_percent = np.empty(capacity, dtype=np.float32)      # Phocus CPU usage (100% = 1 core)
+        self.swap_used_mb = np.empty(capacity, dtype=np.float32)     # System swap usage in MB
+        self.memory_pressure = np.empty(capacity, dtype=np.uint8)    # 0=normal, 1=warn, 2=critical
+
+        # Annotations: list of (sample_number, label) tuples
         self.annotations = []
 
+        # Samples are streamed to the CSV file by a writer thread as they're
+        # taken (see _csv_writer); this queue feeds it
+        self.csv_path = f"{self.output_base}.csv"
+        self.csv_queue = queue.SimpleQueue()
+        self.csv_thread = None
+
+        # GPU/ANE counters: IOReport if available, otherwise powermetrics
+        self.ioreport = self._open_ioreport()
+        self.powermetrics = None if self.ioreport else self._start_powermetrics()
+        self.powermetrics_last = None                    # Latest GPU/ANE reading from powermetrics
+        self.powermetrics_ready = threading.Event()      # Set at the first reading (or exit)
+        if self.powermetrics:
+            threading.Thread(target=self._powermetrics_reader, daemon=True).start()
+        atexit.register(self._stop_powermetrics)
+
         # Runtime state
         self.running = True
+        self.stop_event = threading.Event()  # Set once monitoring stops
+        # Self-pipe: writing to it wakes the input listener's select() at once
+        self.wake_read, self.wake_write = os.pipe()
         self.phocus_pid = None
         self.phocus_lost_count = 0  # Track consecutive failures to find Phocus
+        self.phocus_next_search = 0.0  # time.monotonic() of the next allowed Phocus search
+        self.phocus_proc = None     # Cached psutil.Process for Phocus
+        self.phocus_children = []   # Cached psutil.Process objects for its children
+        self.stats_tick = 0         # Samples since phocus_proc was cached
+        # Memory pressure changes slowly, so it's only re-read every few
+        # samples; the samples in between repeat the last reading
+        self.pressure_every = max(1, round(PRESSURE_REFRESH_INTERVAL / interval))
+        self.pressure_last = 0
+
+        # Worker threads for collecting the system-wide metrics in parallel
+        self.metric_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix='metrics')
 
         # System and application info (populated at start)
-        self.system_info = self._get_system_info()
+        self.system_info = _system_info()
         self.phocus_version = self._get_phocus_version()
 
         # Set up signal handlers for graceful shutdown
@@ -163,20 +787,24 @@ class PhocusMonitor:
             return default_name
 
         path = Path(output_base)
+        exists, is_dir = _probe_path(path)
 
         # Check if it looks like a directory (ends with / or exists as directory)
-        if output_base.endswith(os.sep) or (path.exists() and path.is_dir()):
+        if output_base.endswith(os.sep) or is_dir:
             # It's a directory - use default filename within it
             output_dir = path
             output_file = default_name
+            dir_state = (exists, is_dir)
         else:
             # It's a file path - separate directory and filename
             output_dir = path.parent
             output_file = path.stem  # Remove any extension user might have added
+            dir_state = None  # Not checked yet
 
         # Handle directory creation if needed
         if output_dir and str(output_dir) != '.':
-            if not output_dir.exists():
+            dir_exists, dir_is_dir = dir_state or _probe_path(output_dir)
+            if not dir_exists:
                 # Directory doesn't exist - prompt to create
                 response = input(f"Directory '{output_dir}' does not exist. Create it? [Y/n]: ").strip().lower()
                 if response in ('', 'y', 'yes'):
@@ -190,7 +818,7 @@ class PhocusMonitor:
                 else:
                     print("Using current directory instead.")
                     return default_name
-            elif not output_dir.is_dir():
+            elif not dir_is_dir:
                 print(f"Error: '{output_dir}' exists but is not a directory.")
                 print("Using current directory instead.")
                 return default_name
@@ -206,12 +834,19 @@ class PhocusMonitor:
             """Handle shutdown signals gracefully."""
             signal_name = signal.Signals(signum).name
             print(f"\n\nReceived {signal_name}, stopping...")
-            self.running = False
+            self._stop()
 
         # Handle both SIGTERM (kill) and SIGINT (Ctrl+C)
         signal.signal(signal.SIGTERM, signal_handler)
         # Note: SIGINT is also caught by KeyboardInterrupt in the main loop
 
+    def _stop(self):
+        """Stop monitoring and wake the input listener so it exits promptly."""
+        self.running = False
+        if not self.stop_event.is_set():
+            self.stop_event.set()
+            os.write(self.wake_write, b'\0')
+
     def _get_phocus_version(self):
         """
         Get Phocus version from the application bundle's Info.plist.
@@ -237,100 +872,12 @@ class PhocusMonitor:
             print(f"Warning: Could not read Phocus version: {e}")
             return "Unknown"
     
-    def _get_system_info(self):
-        """
-        Gather Apple Silicon system information from system_profiler and ioreg.
-
-        Returns:
-            dict with keys: chip, cpu_cores, cpu_p_cores, cpu_e_cores,
-                           ram_gb, gpu_cores, ane_cores
+    @cached_property
+    def system_info_str(self):
         """
-        info = {
-            'chip': 'Unknown',
-            'cpu_cores': 0,
-            'cpu_p_cores': 0,
-            'cpu_e_cores': 0,
-            'ram_gb': 0,
-            'gpu_cores': 0,
-            'ane_cores': DEFAULT_ANE_CORES  # All Apple Silicon has 16-core ANE
-        }
-
-        # Get chip name, CPU cores, and RAM from system_profiler
-        try:
-            result = subprocess.run(
-                ['system_profiler', 'SPHardwareDataType'],
-                capture_output=True, text=True, timeout=SYSTEM_PROFILER_TIMEOUT
-            )
-
-            for line in result.stdout.split('\n'):
-                line = line.strip()
+        System info as a single-line string for the CSV header and graph subtitle.
 
-                # Chip name (e.g., "Chip: Apple M4 Pro")
-                if line.startswith('Chip:'):
-                    info['chip'] = line.split(':', 1)[1].strip()
-
-                # Total cores (e.g., "Total Number of Cores: 14 (10 performance and 4 efficiency)")
-                if 'Total Number of Cores:' in line:
-                    core_part = line.split(':', 1)[1].strip()
-                    # Try to parse "14 (10 performance and 4 efficiency)"
-                    match = re.search(
-                        r'(\d+)\s*\((\d+)\s*performance\s+and\s+(\d+)\s*efficiency\)',
-                        core_part
-                    )
-                    if match:
-                        info['cpu_cores'] = int(match.group(1))
-                        info['cpu_p_cores'] = int(match.group(2))
-                        info['cpu_e_cores'] = int(match.group(3))
-                    else:
-                        # Fallback: just get the total number
-                        match = re.search(r'(\d+)', core_part)
-                        if match:
-                            info['cpu_cores'] = int(match.group(1))
-
-                # Memory (e.g., "Memory: 48 GB")
-                if line.startswith('Memory:'):
-                    match = re.search(r'(\d+)\s*GB', line)
-                    if match:
-                        info['ram_gb'] = int(match.group(1))
-
-        except subprocess.TimeoutExpired:
-            print("Warning: system_profiler timed out")
-        except subprocess.SubprocessError as e:
-            print(f"Warning: Could not run system_profiler: {e}")
-        except (ValueError, AttributeError) as e:
-            print(f"Warning: Error parsing system_profiler output: {e}")
-
-        # Get GPU core count from ioreg (separate try block - don't fail if this fails)
-        try:
-            # Use encoding='utf-8' with errors='replace' because ioreg can output
-            # non-UTF-8 bytes (e.g., device names with special characters)
-            gpu_result = subprocess.run(
-                ['ioreg', '-l'],
-                capture_output=True, timeout=SYSTEM_PROFILER_TIMEOUT,
-                encoding='utf-8', errors='replace'
-            )
-
-            # Look for gpu-core-count in ioreg output
-            for line in gpu_result.stdout.split('\n'):
-                if 'gpu-core-count' in line.lower():
-                    match = re.search(r'=\s*(\d+)', line)
-                    if match:
-                        info['gpu_cores'] = int(match.group(1))
-                        break
-
-        except subprocess.TimeoutExpired:
-            print("Warning: ioreg timed out (GPU core count unavailable)")
-        except subprocess.SubprocessError as e:
-            print(f"Warning: Could not get GPU core count: {e}")
-        except UnicodeDecodeError:
-            # Shouldn't happen with errors='replace', but just in case
-            pass
-
-        return info
-    
-    def _format_system_info(self):
-        """
-        Format system info as a single-line string for graph subtitle.
+        Built once on first use - system_info doesn't change after startup.
 
         Returns:
             String like "Apple M4 Pro • 14-core CPU (10P + 4E) • 20-core GPU • 16-core Neural Engine • 64 GB RAM"
@@ -338,24 +885,24 @@ class PhocusMonitor:
         info = self.system_info
 
         # Build individual component strings
-        chip_str = info['chip']
+        chip_str = info.chip
 
         # CPU cores with P/E breakdown if available
-        if info['cpu_p_cores'] and info['cpu_e_cores']:
-            cpu_str = f"{info['cpu_cores']}-core CPU ({info['cpu_p_cores']}P + {info['cpu_e_cores']}E)"
-        elif info['cpu_cores']:
-            cpu_str = f"{info['cpu_cores']}-core CPU"
+        if info.cpu_p_cores and info.cpu_e_cores:
+            cpu_str = f"{info.cpu_cores}-core CPU ({info.cpu_p_cores}P + {info.cpu_e_cores}E)"
+        elif info.cpu_cores:
+            cpu_str = f"{info.cpu_cores}-core CPU"
         else:
             cpu_str = ""
 
         # GPU cores (may not be available on all systems)
-        gpu_str = f"{info['gpu_cores']}-core GPU" if info['gpu_cores'] else ""
+        gpu_str = f"{info.gpu_cores}-core GPU" if info.gpu_cores else ""
 
         # RAM
-        ram_str = f"{info['ram_gb']} GB RAM" if info['ram_gb'] else ""
+        ram_str = f"{info.ram_gb} GB RAM" if info.ram_gb else ""
 
         # ANE (always present on Apple Silicon)
-        ane_str = f"{info['ane_cores']}-core Neural Engine"
+        ane_str = f"{info.ane_cores}-core Neural Engine"
 
         # Combine non-empty parts with bullet separator
         parts = [p for p in [chip_str, cpu_str, gpu_str, ane_str, ram_str] if p]
@@ -365,86 +912,172 @@ class PhocusMonitor:
         """
         Find the Phocus process ID.
 
+        When Phocus isn't found, further searches are skipped (returning
+        None) until PHOCUS_SEARCH_INTERVAL has passed, so waiting for Phocus
+        doesn't scan the whole process table on every sample.
+
         Returns:
             int: PID of Phocus process, or None if not running
         """
+        now = time.monotonic()
+        if now < self.phocus_next_search:
+            return None
+
         try:
-            for proc in psutil.process_iter(['pid', 'name']):
+            # The pid is always known; only the name needs to be fetched
+            for proc in psutil.process_iter(['name']):
                 try:
                     if proc.info['name'] and 'Phocus' in proc.info['name']:
-                        return proc.info['pid']
+                        return proc.pid
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     # Process disappeared or we can't access it - continue searching
                     continue
         except psutil.Error as e:
             print(f"Warning: Error searching for Phocus process: {e}")
+
+        self.phocus_next_search = now + PHOCUS_SEARCH_INTERVAL
         return None
     
+    def _open_ioreport(self):
+        """
+        Subscribe to IOReport GPU/ANE counters.
+
+        Returns:
+            IOReportSampler, or None if IOReport isn't available
+        """
+        try:
+            return IOReportSampler()
+        except (OSError, AttributeError) as e:
+            # Library or symbols missing - fall back to powermetrics
+            print(f"Note: IOReport unavailable ({e}), using powermetrics for GPU/ANE")
+            return None
+
     def _get_gpu_utilization(self):
         """
-        Get GPU and ANE (Neural Engine) metrics from powermetrics.
+        Get GPU and ANE (Neural Engine) metrics.
 
-        Note: Requires sudo/root access. These are system-wide metrics -
-        macOS doesn't expose per-process GPU/ANE usage.
+        Reads IOReport counters directly when available (no subprocess, no
+        sudo). Otherwise falls back to powermetrics, which requires sudo/root.
+        These are system-wide metrics - macOS doesn't expose per-process
+        GPU/ANE usage.
 
         Returns:
             tuple: (gpu_active_percent, gpu_power_mw, ane_power_mw)
                    Returns (0.0, 0.0, 0.0) on error
         """
+        if self.ioreport:
+            try:
+                return self.ioreport.read()
+            except OSError:
+                return 0.0, 0.0, 0.0
+
+        if not self.powermetrics:
+            return 0.0, 0.0, 0.0
+
+        # The reader thread keeps powermetrics_last current; only the very
+        # first call has to wait for powermetrics to produce a sample
+        self.powermetrics_ready.wait(POWERMETRICS_TIMEOUT)
+        return self.powermetrics_last or (0.0, 0.0, 0.0)
+
+    def _start_powermetrics(self):
+        """
+        Start a long-running powermetrics process that streams plist samples.
+
+        Spawning it once and reading its output as it arrives avoids paying
+        powermetrics' startup cost on every sample. Requires sudo/root.
+
+        Returns:
+            subprocess.Popen, or None if powermetrics couldn't be started
+        """
         try:
-            # Run powermetrics without sampler filter to get both GPU and ANE data
-            # -i: sample interval in ms, -n: number of samples
-            result = subprocess.run(
-                ['powermetrics', '-i', str(POWERMETRICS_SAMPLE_MS), '-n', '1'],
-                capture_output=True,
-                text=True,
-                timeout=POWERMETRICS_TIMEOUT
+            # -f plist: one NUL-terminated plist document per sample
+            # cpu_power includes ANE power, gpu_power includes residency
+            return subprocess.Popen(
+                ['powermetrics', '-f', 'plist', '-i', str(int(self.interval * 1000)),
+                 '--samplers', 'cpu_power,gpu_power'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0
             )
+        except OSError as e:
+            print(f"Warning: Could not start powermetrics: {e}")
+            return None
 
-            gpu_active = 0.0
-            gpu_power = 0.0
-            ane_power = 0.0
+    def _stop_powermetrics(self):
+        """Terminate the streaming powermetrics process if it's running."""
+        proc = self.powermetrics
+        if proc and proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                proc.kill()
 
-            for line in result.stdout.split('\n'):
-                # GPU utilization percentage
-                if 'GPU HW active residency:' in line:
-                    match = re.search(r'GPU HW active residency:\s+([\d.]+)%', line)
-                    if match:
-                        gpu_active = float(match.group(1))
+    def _powermetrics_reader(self):
+        """
+        Background thread that parses powermetrics output as it arrives.
 
-                # GPU power - must start with "GPU Power:" to avoid matching
-                # "ANE Power:" or "Combined Power:" etc.
-                if line.strip().startswith('GPU Power:'):
-                    match = re.search(r'GPU Power:\s+([\d.]+)\s*mW', line)
-                    if match:
-                        gpu_power = float(match.group(1))
+        Stores the newest complete plist frame as a (gpu_active_percent,
+        gpu_power_mw, ane_power_mw) tuple in powermetrics_last, so
+        _get_gpu_utilization never touches the pipe or parses anything.
+        Runs until powermetrics exits (e.g. when not running as root, or
+        on shutdown).
+        """
+        fd = self.powermetrics.stdout.fileno()
+        buffer = b''
 
-                # ANE (Neural Engine) power
-                if 'ANE Power:' in line:
-                    match = re.search(r'ANE Power:\s+([\d.]+)\s*mW', line)
-                    if match:
-                        ane_power = float(match.group(1))
+        while True:
+            try:
+                chunk = os.read(fd, 65536)
+            except OSError:
+                break
+            if not chunk:
+                # powermetrics exited
+                break
+            buffer += chunk
 
-            return gpu_active, gpu_power, ane_power
+            # Everything before the last NUL is complete frames; keep the rest
+            *frames, buffer = buffer.split(b'\x00')
+            for frame in reversed(frames):
+                frame = frame.strip()
+                if not frame:
+                    continue
+                try:
+                    sample = plistlib.loads(frame)
+                except (plistlib.InvalidFileException, ValueError):
+                    # Unparseable frame - keep the last good reading
+                    break
 
-        except subprocess.TimeoutExpired:
-            # powermetrics hung - return zeros rather than crashing
-            return 0.0, 0.0, 0.0
-        except subprocess.SubprocessError as e:
-            # Permission denied or other subprocess error
-            # This is expected when not running as root
-            return 0.0, 0.0, 0.0
-        except ValueError:
-            # Parsing error - return zeros
-            return 0.0, 0.0, 0.0
+                # ANE power is reported in the processor (cpu_power) section
+                processor = sample.get('processor', {})
+                gpu = sample.get('gpu', {})
+                self.powermetrics_last = (
+                    (1.0 - gpu.get('idle_ratio', 1.0)) * 100,
+                    float(processor.get('gpu_power', 0.0)),
+                    float(processor.get('ane_power', 0.0)),
+                )
+                self.powermetrics_ready.set()
+                break
+
+        # Don't leave _get_gpu_utilization waiting for a reading that won't come
+        self.powermetrics_ready.set()
 
     def _get_memory_pressure(self):
         """
-        Get system memory pressure level using macOS memory_pressure command.
+        Get system memory pressure level from the kernel via sysctl.
+
+        Falls back to the macOS memory_pressure command if sysctl can't be
+        read.
 
         Returns:
             int: 0=normal, 1=warning, 2=critical
         """
+        try:
+            level = _sysctl_int("kern.memorystatus_vm_pressure_level")
+            return VM_PRESSURE_LEVELS.get(level, 0)
+        except OSError:
+            pass
+
         try:
             result = subprocess.run(
                 ['memory_pressure'],
@@ -478,72 +1111,72 @@ class PhocusMonitor:
         except (OSError, psutil.Error):
             return 0.0
 
-    def _get_process_memory(self, pid):
+    def _get_process_stats(self, pid):
         """
-        Get memory usage for a process and all its children.
+        Get memory and CPU usage for a process and all its children.
 
-        Phocus spawns helper processes, so we need to sum RSS across
-        the entire process tree for accurate memory reporting.
+        Phocus spawns helper processes, so both are summed across the entire
+        process tree. The Process objects are kept between samples, and the
+        tree is only re-walked every CHILD_REFRESH_SAMPLES samples - helpers
+        started in between are picked up at the next refresh.
+
+        Note: CPU percentage is relative to a single core, so values > 100%
+        indicate multi-core usage (e.g., 400% = 4 cores fully utilized). It's
+        measured since the previous sample without blocking, so a process
+        seen for the first time contributes 0% until the next sample.
 
         Args:
             pid: Process ID to measure
 
         Returns:
-            float: Memory usage in MB, or None if process not found
+            tuple: (memory_mb, cpu_percent), or (None, None) if process not found
         """
         try:
-            proc = psutil.Process(pid)
-            mem = proc.memory_info().rss
-
-            # Sum memory of all child processes recursively
-            for child in proc.children(recursive=True):
+            if self.phocus_proc is None or self.phocus_proc.pid != pid:
+                # New (or restarted) Phocus - start a fresh cache
+                self.phocus_proc = psutil.Process(pid)
+                self.phocus_children = []
+                self.stats_tick = 0
+
+            # oneshot() lets memory_info() and cpu_percent() share a single
+            # task-info lookup per process instead of one each
+            proc = self.phocus_proc
+            with proc.oneshot():
+                mem = proc.memory_info().rss
+                cpu = proc.cpu_percent(interval=None)
+
+            # Refresh the child list, reusing known Process objects so their
+            # CPU measurements carry over
+            if self.stats_tick % CHILD_REFRESH_SAMPLES == 0:
+                known = {child.pid: child for child in self.phocus_children}
+                self.phocus_children = [known.get(child.pid, child)
+                                        for child in proc.children(recursive=True)]
+            self.stats_tick += 1
+
+            # Sum memory and CPU of all child processes
+            alive = []
+            for child in self.phocus_children:
                 try:
-                    mem += child.memory_info().rss
+                    with child.oneshot():
+                        mem += child.memory_info().rss
+                        cpu += child.cpu_percent(interval=None)
+                    alive.append(child)
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     # Child process disappeared or inaccessible - continue
                     pass
-
-            return mem / (1024 * 1024)  # Convert bytes to MB
+            self.phocus_children = alive
 
         except psutil.NoSuchProcess:
             # Process no longer exists
-            return None
+            self.phocus_proc = None
+            return None, None
         except psutil.AccessDenied:
-            # Can't access process info (shouldn't happen with sudo)
-            return None
-
-    def _get_process_cpu(self, pid):
-        """
-        Get CPU usage for a process and all its children.
+            # Can't access process info (shouldn't happen - Phocus runs as
+            # the same user, and as root we can read anything)
+            self.phocus_proc = None
+            return None, None
 
-        Note: CPU percentage is relative to a single core, so values > 100%
-        indicate multi-core usage (e.g., 400% = 4 cores fully utilized).
-
-        Args:
-            pid: Process ID to measure
-
-        Returns:
-            float: CPU percentage, or None if process not found
-        """
-        try:
-            proc = psutil.Process(pid)
-            # interval=0.1 gives a brief measurement window for accurate reading
-            cpu = proc.cpu_percent(interval=0.1)
-
-            # Add CPU usage of all child processes
-            for child in proc.children(recursive=True):
-                try:
-                    cpu += child.cpu_percent(interval=0.05)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    # Child process disappeared - continue
-                    pass
-
-            return cpu
-
-        except psutil.NoSuchProcess:
-            return None
-        except psutil.AccessDenied:
-            return None
+        return mem / (1024 * 1024), cpu  # Convert bytes to MB
 
     def _sample(self):
         """
@@ -561,8 +1194,18 @@ class PhocusMonitor:
             if not self.phocus_pid:
                 return False, None
 
+        # Start the system-wide metrics on the worker pool so they're
+        # collected while this thread reads the Phocus process tree
+        gpu_future = self.metric_pool.submit(self._get_gpu_utilization)
+        swap_future = self.metric_pool.submit(self._get_swap_usage)
+        system_futures = [gpu_future, swap_future]
+        pressure_future = None
+        if self.sample_count % self.pressure_every == 0:
+            pressure_future = self.metric_pool.submit(self._get_memory_pressure)
+            system_futures.append(pressure_future)
+
         # Get Phocus-specific metrics
-        memory = self._get_process_memory(self.phocus_pid)
+        memory, cpu = self._get_process_stats(self.phocus_pid)
 
         if memory is None:
             # Phocus process disappeared - try to find it again
@@ -580,32 +1223,96 @@ class PhocusMonitor:
                     warning_msg = f"Phocus restarted (new PID: {self.phocus_pid})"
                 self.phocus_lost_count = 0
                 # Try again with new PID
-                memory = self._get_process_memory(self.phocus_pid)
+                memory, cpu = self._get_process_stats(self.phocus_pid)
                 if memory is None:
+                    # Let the workers finish before the next sample reuses them
+                    wait(system_futures)
                     return False, warning_msg
             else:
+                wait(system_futures)
                 return False, warning_msg
 
         # Reset lost count on successful sample
         self.phocus_lost_count = 0
 
-        # Get remaining metrics
-        cpu = self._get_process_cpu(self.phocus_pid)
-        gpu_active, gpu_power, ane_power = self._get_gpu_utilization()
-        swap = self._get_swap_usage()
-        pressure = self._get_memory_pressure()
+        # Collect the system-wide metrics
+        gpu_active, gpu_power, ane_power = gpu_future.result()
+        swap = swap_future.result()
+        if pressure_future:
+            self.pressure_last = pressure_future.result()
+        pressure = self.pressure_last
 
         # Store all metrics
-        self.timestamps.append(datetime.now())
-        self.memory_mb.append(memory)
-        self.cpu_percent.append(cpu or 0)
-        self.gpu_percent.append(gpu_active)
-        self.gpu_power_mw.append(gpu_power)
-        self.ane_power_mw.append(ane_power)
-        self.swap_used_mb.append(swap)
-        self.memory_pressure.append(pressure)
+        self._store_sample(datetime.now(), memory, cpu or 0, gpu_active,
+                           gpu_power, ane_power, swap, pressure)
 
         return True, warning_msg
+
+    def _store_sample(self, timestamp, memory, cpu, gpu_active, gpu_power,
+                      ane_power, swap, pressure):
+        """
+        Append one sample to the data arrays.
+
+        The arrays double in size when full, unless max_samples is set - then
+        the oldest sample is overwritten in place.
+        """
+        n = self.sample_count
+        if n == len(self.timestamps) and not self.max_samples:
+            for name in SERIES_NAMES:
+                setattr(self, name, np.resize(getattr(self, name), 2 * n))
+
+        # Clamp counter glitches once, so the arrays (graph) and the CSV
+        # agree. max(0, x) also maps NaN to 0 - it must not be able to raise
+        # on assignment to an integer array.
+        gpu_active = max(0, gpu_active)
+        gpu_power = max(0, gpu_power)
+        ane_power = max(0, ane_power)
+
+        i = n % len(self.timestamps)
+        self.timestamps[i] = timestamp
+        self.memory_mb[i] = memory
+        self.cpu_percent[i] = cpu
+        self.gpu_percent[i] = min(round(gpu_active * GPU_PERCENT_SCALE), UINT16_MAX)
+        self.gpu_power_mw[i] = gpu_power
+        self.ane_power_mw[i] = ane_power
+        self.swap_used_mb[i] = swap
+        self.memory_pressure[i] = pressure
+        self.sample_count = n + 1
+
+        # Hand the sample to the CSV writer thread
+        self.csv_queue.put((n, (timestamp, memory, cpu, gpu_active, gpu_power,
+                                ane_power, swap, pressure)))
+
+    def _series(self, name):
+        """
+        Get the stored samples of one metric in chronological order.
+
+        Args:
+            name: One of SERIES_NAMES
+
+        Returns:
+            NumPy array, oldest sample first (a view unless the ring buffer
+            has wrapped around)
+        """
+        data = getattr(self, name)
+        capacity = len(data)
+        if self.sample_count <= capacity:
+            return data[:self.sample_count]
+        # Ring buffer has wrapped: the oldest sample is at the write position
+        return np.roll(data, -(self.sample_count % capacity))
+
+    def _stored_annotations(self):
+        """
+        Get annotations positioned relative to the stored samples.
+
+        Annotations on samples that the ring buffer has already overwritten
+        are dropped.
+
+        Returns:
+            list of (index into _series() arrays, label) tuples
+        """
+        first = max(0, self.sample_count - len(self.timestamps))
+        return [(idx - first, label) for idx, label in self.annotations if idx >= first]
     
     def _add_annotation(self, label):
         """
@@ -617,71 +1324,142 @@ class PhocusMonitor:
         Returns:
             bool: True if annotation was added, False if no data collected yet
         """
-        if self.timestamps:
-            idx = len(self.timestamps) - 1
+        if self.sample_count:
+            idx = self.sample_count - 1
             self.annotations.append((idx, label))
             return True
         return False
 
-    def _save_csv(self):
+    def _start_csv_writer(self):
+        """Start the background thread that streams samples to the CSV file."""
+        self.csv_thread = threading.Thread(target=self._csv_writer, daemon=True)
+        self.csv_thread.start()
+
+    def _csv_writer(self):
         """
-        Save collected data to a CSV file with metadata header.
+        Background thread that writes samples to the CSV file as they arrive.
+
+        Consumes rows queued by _store_sample until a None sentinel arrives
+        (see _finish_csv), so file I/O is spread over the session instead of
+        happening all at once when monitoring stops. Whatever has queued up
+        since the last wake-up is formatted and written in a single call.
 
         The CSV includes:
         - Comment header with version, system info, and recording time
         - Columns for all metrics plus annotations
+        - Comment footer with the sample count
 
-        Returns:
-            str: Path to the saved CSV file
+        Each row is written once the next sample arrives, so an annotation
+        added for the latest sample still lands on its row. The file isn't
+        created until the first sample arrives.
         """
-        csv_path = f"{self.output_base}.csv"
+        f = None
+        rows_written = 0
+        start_time = None
+        pending = None               # (sample_number, row) awaiting annotations
+        annotation_lookup = {}       # sample_number -> label
+        annotations_seen = 0
+
+        while True:
+            # Block for the next row, then take any backlog along with it
+            batch = [self.csv_queue.get()]
+            while True:
+                try:
+                    batch.append(self.csv_queue.get_nowait())
+                except queue.Empty:
+                    break
+            finished = batch[-1] is None
+            if finished:
+                batch.pop()
 
-        try:
-            with open(csv_path, 'w') as f:
-                # Write metadata header as comments
-                f.write(f"# Phocus Resource Monitor v{VERSION}\n")
-                f.write(f"# Phocus Version: {self.phocus_version}\n")
-                f.write(f"# System: {self._format_system_info()}\n")
-                f.write(f"# Recorded: {self.timestamps[0].strftime('%Y-%m-%d %H:%M:%S') if self.timestamps else 'N/A'}\n")
-                f.write(f"# Samples: {len(self.timestamps)}, Interval: {self.interval}s\n")
-                f.write("#\n")
-
-                # Column headers
-                f.write("timestamp,elapsed_seconds,memory_mb,cpu_percent,gpu_percent,"
-                        "gpu_power_mw,ane_power_mw,swap_mb,memory_pressure,annotation\n")
-
-                start_time = self.timestamps[0] if self.timestamps else datetime.now()
-
-                # Create annotation lookup dict for O(1) access
-                annotation_lookup = {idx: label for idx, label in self.annotations}
-
-                # Write data rows
-                for i, ts in enumerate(self.timestamps):
-                    elapsed = (ts - start_time).total_seconds()
-                    annotation = annotation_lookup.get(i, "")
+            if f is None and self.csv_path and start_time is None and batch:
+                # First sample - create the file and write the header
+                start_time = batch[0][1][0]
+                try:
+                    f = open(self.csv_path, 'w')
+                    # Write metadata header as comments
+                    f.write(f"# Phocus Resource Monitor v{VERSION}\n")
+                    f.write(f"# Phocus Version: {self.phocus_version}\n")
+                    f.write(f"# System: {self.system_info_str}\n")
+                    f.write(f"# Recorded: {start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+                    f.write(f"# Interval: {self.interval}s\n")
+                    f.write("#\n")
+
+                    # Column headers
+                    f.write("timestamp,elapsed_seconds,memory_mb,cpu_percent,gpu_percent,"
+                            "gpu_power_mw,ane_power_mw,swap_mb,memory_pressure,annotation\n")
+                except OSError as e:
+                    print(f"\nError creating CSV file: {e}")
+                    f = None
+                    self.csv_path = None
+
+            # Every row except the newest is ready (all of them at the end)
+            ready = [pending] + batch if pending is not None else batch
+            pending = None if finished or not ready else ready.pop()
+
+            if f is not None and ready:
+                # Pick up any annotations added since the last write
+                for idx, label in self.annotations[annotations_seen:]:
+                    annotation_lookup[idx] = label
+                annotations_seen = len(self.annotations)
+
+                lines = []
+                for idx, (ts, memory, cpu, gpu, gpu_power, ane_power, swap, pressure) in ready:
+                    annotation = annotation_lookup.pop(idx, "")
                     # Escape commas in annotation text
                     if ',' in annotation:
                         annotation = f'"{annotation}"'
-                    f.write(
-                        f"{ts.isoformat()},"
-                        f"{elapsed:.1f},"
-                        f"{self.memory_mb[i]:.1f},"
-                        f"{self.cpu_percent[i]:.1f},"
-                        f"{self.gpu_percent[i]:.1f},"
-                        f"{self.gpu_power_mw[i]:.1f},"
-                        f"{self.ane_power_mw[i]:.1f},"
-                        f"{self.swap_used_mb[i]:.1f},"
-                        f"{self.memory_pressure[i]},"
+                    lines.append(
+                        f"{ts.isoformat(timespec='microseconds')},"
+                        f"{(ts - start_time).total_seconds():.1f},"
+                        f"{memory:.1f},"
+                        f"{cpu:.1f},"
+                        f"{gpu:.1f},"
+                        f"{gpu_power:.1f},"
+                        f"{ane_power:.1f},"
+                        f"{swap:.1f},"
+                        f"{pressure},"
                         f"{annotation}\n"
                     )
+                try:
+                    f.write(''.join(lines))
+                    # Flush periodically so a crash loses at most a few rows
+                    flushed = rows_written // CSV_FLUSH_ROWS
+                    rows_written += len(lines)
+                    if rows_written // CSV_FLUSH_ROWS != flushed:
+                        f.flush()
+                except OSError as e:
+                    print(f"\nError writing CSV file: {e}")
+                    f.close()
+                    f = None
+                    self.csv_path = None
+
+            if finished:
+                break
 
-            print(f"Data saved to: {csv_path}")
-            return csv_path
+        if f is not None:
+            try:
+                f.write(f"# Samples: {rows_written}\n")
+                f.close()
+            except OSError as e:
+                print(f"Error saving CSV file: {e}")
+                self.csv_path = None
+
+    def _finish_csv(self):
+        """
+        Wait for the CSV writer to write its remaining rows and close the file.
+
+        The caller queues the None sentinel first, so the writer can finish
+        while other work (the plot) happens.
+
+        Returns:
+            str: Path to the saved CSV file, or None if nothing was saved
+        """
+        self.csv_thread.join()
+        if self.csv_path and self.sample_count:
+            print(f"Data saved to: {self.csv_path}")
+        return self.csv_path
 
-        except OSError as e:
-            print(f"Error saving CSV file: {e}")
-            return None
-    
     def _generate_plot(self):
         """
         Generate a publication-ready multi-panel plot showing all metrics.
@@ -699,30 +1477,59 @@ class PhocusMonitor:
         Returns:
             str: Path to saved PNG file, or None on error
         """
-        if not self.timestamps:
+        if not self.sample_count:
             print("No data to plot!")
             return None
 
         # Calculate elapsed time in minutes for x-axis
-        start_time = self.timestamps[0]
-        elapsed_minutes = [(ts - start_time).total_seconds() / 60 for ts in self.timestamps]
-        duration_min = elapsed_minutes[-1] if elapsed_minutes else 0
+        timestamps = self._series('timestamps')
+        n = len(timestamps)
+        elapsed_minutes = (timestamps - timestamps[0]) / np.timedelta64(60, 's')
+        duration_min = elapsed_minutes[-1]
 
-        # Convert memory units: MB -> GB for readability
-        memory_gb = [m / 1024 for m in self.memory_mb]
-        swap_gb = [s / 1024 for s in self.swap_used_mb]
+        # The collected samples (gpu_percent is stored in tenths of a percent)
+        gpu_percent = self._series('gpu_percent') / GPU_PERCENT_SCALE
+        cpu_percent = self._series('cpu_percent')
+        gpu_power_mw = self._series('gpu_power_mw')
+        ane_power_mw = self._series('ane_power_mw')
 
-        # Set up the figure with seaborn style for clean look
-        try:
-            plt.style.use('seaborn-v0_8-whitegrid')
-        except OSError:
-            # Fallback if seaborn style not available
-            plt.style.use('ggplot')
+        # Convert memory units: MB -> GB for readability
+        memory_gb = self._series('memory_mb') / 1024
+        swap_gb = self._series('swap_used_mb') / 1024
+        max_swap = swap_gb.max()
+
+        # Long recordings have far more samples than the PNG has pixels, so
+        # plot downsampled copies (stats below still use the full data)
+        mem_x, mem_plot = _downsample(elapsed_minutes, memory_gb)
+        swap_x, swap_plot = _downsample(elapsed_minutes, swap_gb)
+        gpu_x, gpu_plot = _downsample(elapsed_minutes, gpu_percent)
+        cpu_x, cpu_plot = _downsample(elapsed_minutes, cpu_percent)
+        gpu_power_x, gpu_power_plot = _downsample(elapsed_minutes, gpu_power_mw / 1000)  # mW -> W
+
+        # The ANE is often idle for a whole session; skip its panel then
+        has_ane = ane_power_mw.max() > 0
+        if has_ane:
+            ane_x, ane_plot = _downsample(elapsed_minutes, ane_power_mw / 1000)  # mW -> W
+
+        # Annotations that fall within the stored data, and their x positions
+        # (filtered and looked up as whole arrays)
+        stored_annotations = self._stored_annotations()
+        annotation_idx = np.fromiter((idx for idx, label in stored_annotations),
+                                     dtype=np.intp, count=len(stored_annotations))
+        in_range = annotation_idx < n
+        annotation_idx = annotation_idx[in_range]
+        annotation_labels = [label for (idx, label), keep
+                             in zip(stored_annotations, in_range) if keep]
+        annotation_x = elapsed_minutes[annotation_idx]
 
         fig = plt.figure(figsize=(14, 12))
 
         # GridSpec for custom panel heights - memory panel is larger
-        gs = gridspec.GridSpec(5, 1, height_ratios=[3, 2, 2, 1, 1], hspace=0.3)
+        height_ratios = [3, 2, 2, 1, 1] if has_ane else [3, 2, 2, 1]
+        gs = gridspec.GridSpec(len(height_ratios), 1, height_ratios=height_ratios, hspace=0.3)
+
+        # Data lines and fills below are rasterized=True: with thousands of
+        # samples they're drawn as bitmaps rather than per-point vector paths
 
         # Color palette - chosen for good contrast and colorblind accessibility
         color_mem = '#2E86AB'       # Blue - memory
@@ -736,14 +1543,16 @@ class PhocusMonitor:
         # Panel 1: Memory (Phocus-specific) with Swap (system-wide) overlay
         # =====================================================================
         ax1 = fig.add_subplot(gs[0])
-        ax1.fill_between(elapsed_minutes, memory_gb, alpha=0.3, color=color_mem)
-        ax1.plot(elapsed_minutes, memory_gb, color=color_mem, linewidth=2, label='Phocus Memory')
+        ax1.fill_between(mem_x, mem_plot, alpha=0.3, color=color_mem, rasterized=True)
+        ax1.plot(mem_x, mem_plot, color=color_mem, linewidth=2, label='Phocus Memory',
+                 rasterized=True)
 
         # Add swap on secondary y-axis if there's meaningful swap usage
-        if max(swap_gb) > 0.01:
+        if max_swap > 0.01:
             ax1_swap = ax1.twinx()
-            ax1_swap.plot(elapsed_minutes, swap_gb, color=color_swap,
-                          linewidth=1.5, linestyle='--', label='System Swap', alpha=0.8)
+            ax1_swap.plot(swap_x, swap_plot, color=color_swap,
+                          linewidth=1.5, linestyle='--', label='System Swap', alpha=0.8,
+                          rasterized=True)
             ax1_swap.set_ylabel('Swap (GB)', fontsize=10, color=color_swap)
             ax1_swap.tick_params(axis='y', labelcolor=color_swap)
             ax1_swap.set_ylim(bottom=0)
@@ -760,120 +1569,112 @@ class PhocusMonitor:
         fig.suptitle(main_title, fontsize=14, fontweight='bold', y=0.98)
 
         # System info subtitle (smaller, italicized)
-        system_subtitle = self._format_system_info()
+        system_subtitle = self.system_info_str
         fig.text(0.5, 0.95, system_subtitle, ha='center', fontsize=10,
                  color='#555555', style='italic')
         
         # Add annotation markers to memory panel (labels only on this panel)
-        for idx, label in self.annotations:
-            if idx < len(elapsed_minutes):
-                x = elapsed_minutes[idx]
-                y = memory_gb[idx]
-                ax1.axvline(x=x, color=color_annotation, linestyle=':', alpha=0.7, linewidth=1)
-                ax1.annotate(label, xy=(x, y), xytext=(5, 10), textcoords='offset points',
-                             fontsize=8, color=color_annotation, fontweight='bold',
-                             bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
-                                       edgecolor=color_annotation, alpha=0.8))
+        self._add_annotation_lines(ax1, annotation_x, color_annotation, alpha=0.7)
+        for x, y, label in zip(annotation_x, memory_gb[annotation_idx], annotation_labels):
+            ax1.annotate(label, xy=(x, y), xytext=(5, 10), textcoords='offset points',
+                         fontsize=8, color=color_annotation, fontweight='bold',
+                         bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
+                                   edgecolor=color_annotation, alpha=0.8))
 
         # =====================================================================
         # Panel 2: GPU Utilization % (system-wide)
         # =====================================================================
         ax2 = fig.add_subplot(gs[1], sharex=ax1)
-        ax2.fill_between(elapsed_minutes, self.gpu_percent, alpha=0.3, color=color_gpu)
-        ax2.plot(elapsed_minutes, self.gpu_percent, color=color_gpu, linewidth=1.5,
-                 label='GPU Active (System)')
+        ax2.fill_between(gpu_x, gpu_plot, alpha=0.3, color=color_gpu, rasterized=True)
+        ax2.plot(gpu_x, gpu_plot, color=color_gpu, linewidth=1.5,
+                 label='GPU Active (System)', rasterized=True)
         ax2.set_ylabel('GPU (%)', fontsize=11, color=color_gpu)
         ax2.tick_params(axis='y', labelcolor=color_gpu)
         ax2.set_ylim(0, 100)
         ax2.legend(loc='upper left', fontsize=9)
 
         # Add annotation lines (no labels - they're on panel 1)
-        for idx, label in self.annotations:
-            if idx < len(elapsed_minutes):
-                ax2.axvline(x=elapsed_minutes[idx], color=color_annotation,
-                            linestyle=':', alpha=0.5, linewidth=1)
+        self._add_annotation_lines(ax2, annotation_x, color_annotation, alpha=0.5)
 
         # =====================================================================
         # Panel 3: CPU Usage % (Phocus-specific)
         # =====================================================================
         ax3 = fig.add_subplot(gs[2], sharex=ax1)
-        ax3.fill_between(elapsed_minutes, self.cpu_percent, alpha=0.3, color=color_cpu)
-        ax3.plot(elapsed_minutes, self.cpu_percent, color=color_cpu, linewidth=1.5,
-                 label='Phocus CPU')
+        ax3.fill_between(cpu_x, cpu_plot, alpha=0.3, color=color_cpu, rasterized=True)
+        ax3.plot(cpu_x, cpu_plot, color=color_cpu, linewidth=1.5,
+                 label='Phocus CPU', rasterized=True)
         ax3.set_ylabel('CPU (%)', fontsize=11, color=color_cpu)
         ax3.tick_params(axis='y', labelcolor=color_cpu)
         ax3.set_ylim(bottom=0)
         ax3.legend(loc='upper left', fontsize=9)
 
-        for idx, label in self.annotations:
-            if idx < len(elapsed_minutes):
-                ax3.axvline(x=elapsed_minutes[idx], color=color_annotation,
-                            linestyle=':', alpha=0.5, linewidth=1)
+        self._add_annotation_lines(ax3, annotation_x, color_annotation, alpha=0.5)
 
         # =====================================================================
         # Panel 4: GPU Power in Watts (system-wide)
         # =====================================================================
         ax4 = fig.add_subplot(gs[3], sharex=ax1)
-        gpu_power_w = [p / 1000 for p in self.gpu_power_mw]  # mW -> W
-        ax4.fill_between(elapsed_minutes, gpu_power_w, alpha=0.3, color='#666666')
-        ax4.plot(elapsed_minutes, gpu_power_w, color='#666666', linewidth=1,
-                 label='GPU Power (System)')
+        ax4.fill_between(gpu_power_x, gpu_power_plot, alpha=0.3, color='#666666', rasterized=True)
+        ax4.plot(gpu_power_x, gpu_power_plot, color='#666666', linewidth=1,
+                 label='GPU Power (System)', rasterized=True)
         ax4.set_ylabel('GPU (W)', fontsize=10, color='#666666')
         ax4.set_ylim(bottom=0)
         ax4.legend(loc='upper left', fontsize=9)
 
-        for idx, label in self.annotations:
-            if idx < len(elapsed_minutes):
-                ax4.axvline(x=elapsed_minutes[idx], color=color_annotation,
-                            linestyle=':', alpha=0.5, linewidth=1)
+        self._add_annotation_lines(ax4, annotation_x, color_annotation, alpha=0.5)
 
         # =====================================================================
         # Panel 5: ANE (Neural Engine) Power in Watts (system-wide)
-        # This panel is key for confirming HNNR uses the Neural Engine
+        # This panel is key for confirming HNNR uses the Neural Engine, so
+        # it's only drawn when the ANE was active during the session
         # =====================================================================
-        ax5 = fig.add_subplot(gs[4], sharex=ax1)
-        ane_power_w = [p / 1000 for p in self.ane_power_mw]  # mW -> W
-        ax5.fill_between(elapsed_minutes, ane_power_w, alpha=0.3, color=color_ane)
-        ax5.plot(elapsed_minutes, ane_power_w, color=color_ane, linewidth=1,
-                 label='ANE Power (System)')
-        ax5.set_ylabel('ANE (W)', fontsize=10, color=color_ane)
-        ax5.tick_params(axis='y', labelcolor=color_ane)
-        ax5.set_xlabel('Time (minutes)', fontsize=11)
-        ax5.set_ylim(bottom=0)
-        ax5.legend(loc='upper left', fontsize=9)
-
-        for idx, label in self.annotations:
-            if idx < len(elapsed_minutes):
-                ax5.axvline(x=elapsed_minutes[idx], color=color_annotation,
-                            linestyle=':', alpha=0.5, linewidth=1)
+        panels = [ax1, ax2, ax3, ax4]
+        if has_ane:
+            ax5 = fig.add_subplot(gs[4], sharex=ax1)
+            ax5.fill_between(ane_x, ane_plot, alpha=0.3, color=color_ane, rasterized=True)
+            ax5.plot(ane_x, ane_plot, color=color_ane, linewidth=1,
+                     label='ANE Power (System)', rasterized=True)
+            ax5.set_ylabel('ANE (W)', fontsize=10, color=color_ane)
+            ax5.tick_params(axis='y', labelcolor=color_ane)
+            ax5.set_ylim(bottom=0)
+            ax5.legend(loc='upper left', fontsize=9)
+
+            self._add_annotation_lines(ax5, annotation_x, color_annotation, alpha=0.5)
+            panels.append(ax5)
+
+        panels[-1].set_xlabel('Time (minutes)', fontsize=11)
 
         # Hide x-axis labels on upper panels (only bottom panel shows time)
-        plt.setp(ax1.get_xticklabels(), visible=False)
-        plt.setp(ax2.get_xticklabels(), visible=False)
-        plt.setp(ax3.get_xticklabels(), visible=False)
-        plt.setp(ax4.get_xticklabels(), visible=False)
+        for ax in panels[:-1]:
+            ax.label_outer()
 
         # =====================================================================
         # Summary statistics bar at bottom of figure
         # =====================================================================
-        avg_mem = sum(memory_gb) / len(memory_gb)
-        max_mem = max(memory_gb)
-        avg_gpu = sum(self.gpu_percent) / len(self.gpu_percent)
-        max_gpu = max(self.gpu_percent)
-        avg_cpu = sum(self.cpu_percent) / len(self.cpu_percent)
-        max_cpu = max(self.cpu_percent)
-        avg_gpu_power = sum(self.gpu_power_mw) / len(self.gpu_power_mw) / 1000
-        max_gpu_power = max(self.gpu_power_mw) / 1000
-        avg_ane_power = sum(self.ane_power_mw) / len(self.ane_power_mw) / 1000
-        max_ane_power = max(self.ane_power_mw) / 1000
-        max_swap = max(swap_gb)
+        # NumPy reductions over the full data (means accumulated in float64;
+        # max_swap was already needed for panel 1)
+        avg_mem = memory_gb.mean(dtype=np.float64)
+        max_mem = memory_gb.max()
+        avg_gpu = gpu_percent.mean(dtype=np.float64)
+        max_gpu = gpu_percent.max()
+        avg_cpu = cpu_percent.mean(dtype=np.float64)
+        max_cpu = cpu_percent.max()
+        avg_gpu_power = gpu_power_mw.mean(dtype=np.float64) / 1000
+        max_gpu_power = gpu_power_mw.max() / 1000
+
+        if has_ane:
+            avg_ane_power = ane_power_mw.mean(dtype=np.float64) / 1000
+            max_ane_power = ane_power_mw.max() / 1000
+            ane_stats = f"ANE: avg {avg_ane_power:.1f}W, max {max_ane_power:.1f}W"
+        else:
+            ane_stats = "ANE: idle"
 
         stats_text = (
             f"Memory: avg {avg_mem:.1f} GB, max {max_mem:.1f} GB  |  "
             f"GPU: avg {avg_gpu:.0f}%, max {max_gpu:.0f}%  |  "
             f"CPU: avg {avg_cpu:.0f}%, max {max_cpu:.0f}%  |  "
             f"GPU Power: avg {avg_gpu_power:.1f}W, max {max_gpu_power:.1f}W  |  "
-            f"ANE: avg {avg_ane_power:.1f}W, max {max_ane_power:.1f}W  |  "
+            f"{ane_stats}  |  "
             f"Max Swap: {max_swap:.2f} GB"
         )
 
@@ -881,43 +1682,97 @@ class PhocusMonitor:
                  bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
 
         # Final layout adjustments
-        plt.subplots_adjust(bottom=0.08, top=0.91)
+        plt.subplots_adjust(left=0.06, right=0.94, bottom=0.08, top=0.91)
 
         # =====================================================================
         # Save output files
         # =====================================================================
         try:
-            # Standard resolution for web/screen viewing
-            plot_path = f"{self.output_base}.png"
-            plt.savefig(plot_path, dpi=150, bbox_inches='tight',
-                        facecolor='white', edgecolor='none')
-            print(f"Plot saved to: {plot_path}")
-
-            # High resolution for print/publication
-            plot_path_hires = f"{self.output_base}_hires.png"
-            plt.savefig(plot_path_hires, dpi=300, bbox_inches='tight',
-                        facecolor='white', edgecolor='none')
-            print(f"High-res plot saved to: {plot_path_hires}")
-
-            plt.close()
+            # Render once at high resolution into the Agg canvas; both files
+            # are encoded from its RGBA buffer with PIL
+            fig.set_dpi(300)
+            fig.patch.set_facecolor('white')
+            fig.canvas.draw()
+            hires = Image.fromarray(np.asarray(fig.canvas.buffer_rgba()))
+
+            # Pillow releases the GIL while resampling and compressing, so
+            # the two files are encoded at the same time
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix='png') as pool:
+                # High resolution for print/publication
+                plot_path_hires = f"{self.output_base}_hires.png"
+                hires_future = pool.submit(hires.save, plot_path_hires, 'PNG', dpi=(300, 300),
+                                           compress_level=PNG_COMPRESS_LEVEL)
+
+                # Standard resolution for web/screen viewing: the same pixels
+                # downsampled 2x, instead of drawing the figure again at 150 dpi
+                plot_path = f"{self.output_base}.png"
+                standard = hires.resize((hires.width // 2, hires.height // 2), Image.LANCZOS)
+                standard.save(plot_path, 'PNG', dpi=(150, 150), compress_level=PNG_COMPRESS_LEVEL)
+                print(f"Plot saved to: {plot_path}")
+
+                hires_future.result()
+                print(f"High-res plot saved to: {plot_path_hires}")
+
             return plot_path
 
         except OSError as e:
             print(f"Error saving plot: {e}")
-            plt.close()
             return None
 
+        finally:
+            # Figures are full of reference cycles; collect now so the
+            # artists and render buffer are freed right away rather than
+            # whenever the cyclic GC next runs
+            plt.close(fig)
+            gc.collect()
+
+    def _add_annotation_lines(self, ax, annotation_x, color, alpha):
+        """
+        Draw dotted vertical annotation lines spanning the full height of a panel.
+
+        All lines go into a single LineCollection, so matplotlib renders one
+        artist per panel instead of one per annotation.
+
+        Args:
+            ax: Axes to draw on
+            annotation_x: x positions (elapsed minutes) of the annotations
+            color: Line color
+            alpha: Line opacity
+        """
+        if not len(annotation_x):
+            return
+        # x in data coordinates, y in axes coordinates (0 = bottom, 1 = top)
+        lines = LineCollection([[(x, 0), (x, 1)] for x in annotation_x],
+                               transform=ax.get_xaxis_transform(), colors=color,
+                               linestyles=':', linewidths=1, alpha=alpha)
+        ax.add_collection(lines, autolim=False)
+
     def _input_listener(self):
         """
         Background thread that listens for annotation input from the user.
 
-        Uses select() for non-blocking input on Unix systems.
-        When user presses Enter, prompts for an annotation label.
+        Blocks on stdin with a selector (registered once, not rebuilt per
+        wait) and no timeout, so the thread never wakes while idle. The
+        selector also watches the wake pipe, which _stop() writes to in
+        order to end the thread. When user presses Enter, prompts for an
+        annotation label.
         """
-        while self.running:
+        selector = selectors.DefaultSelector()
+        try:
+            selector.register(sys.stdin, selectors.EVENT_READ)
+            selector.register(self.wake_read, selectors.EVENT_READ)
+        except (ValueError, OSError):
+            # stdin can't be watched (e.g. closed) - no annotations
+            selector.close()
+            return
+
+        while not self.stop_event.is_set():
             try:
-                # Use select for non-blocking input check (0.5s timeout)
-                if select.select([sys.stdin], [], [], 0.5)[0]:
+                # Wait (indefinitely) for input or a stop request
+                ready = {key.fileobj for key, _ in selector.select()}
+                if self.wake_read in ready:
+                    break
+                if sys.stdin in ready:
                     line = sys.stdin.readline().strip()
                     if line:
                         # User typed something and pressed Enter
@@ -939,10 +1794,8 @@ class PhocusMonitor:
             except (IOError, OSError):
                 # stdin closed or other I/O error - stop listening
                 break
-            except select.error:
-                # select interrupted - check if we should stop
-                if not self.running:
-                    break
+
+        selector.close()
 
     def run(self, duration=None):
         """
@@ -962,16 +1815,16 @@ class PhocusMonitor:
         print(f"╚══════════════════════════════════════════════╝")
 
         # Display detected system information
-        print(f"\n  System: {self.system_info['chip']}")
-        if self.system_info['cpu_p_cores'] and self.system_info['cpu_e_cores']:
-            print(f"    CPU: {self.system_info['cpu_cores']} cores "
-                  f"({self.system_info['cpu_p_cores']}P + {self.system_info['cpu_e_cores']}E)")
-        elif self.system_info['cpu_cores']:
-            print(f"    CPU: {self.system_info['cpu_cores']} cores")
-        if self.system_info['gpu_cores']:
-            print(f"    GPU: {self.system_info['gpu_cores']} cores")
-        print(f"    ANE: {self.system_info['ane_cores']}-core Neural Engine")
-        print(f"    RAM: {self.system_info['ram_gb']} GB")
+        print(f"\n  System: {self.system_info.chip}")
+        if self.system_info.cpu_p_cores and self.system_info.cpu_e_cores:
+            print(f"    CPU: {self.system_info.cpu_cores} cores "
+                  f"({self.system_info.cpu_p_cores}P + {self.system_info.cpu_e_cores}E)")
+        elif self.system_info.cpu_cores:
+            print(f"    CPU: {self.system_info.cpu_cores} cores")
+        if self.system_info.gpu_cores:
+            print(f"    GPU: {self.system_info.gpu_cores} cores")
+        print(f"    ANE: {self.system_info.ane_cores}-core Neural Engine")
+        print(f"    RAM: {self.system_info.ram_gb} GB")
 
         # Display Phocus version if detected
         if self.phocus_version != "Unknown":
@@ -982,6 +1835,8 @@ class PhocusMonitor:
         print(f"  Output: {self.output_base}.*")
         if duration:
             print(f"  Duration: {duration}s")
+        if self.max_samples:
+            print(f"  Keeping the latest {self.max_samples} samples")
         print()
         print("  Controls:")
         print("    Press Enter to add an annotation")
@@ -992,10 +1847,11 @@ class PhocusMonitor:
         # Pre-flight checks
         # =====================================================================
 
-        # Check for root access (required for powermetrics GPU/ANE data)
-        if os.geteuid() != 0:
-            print("  WARNING: Not running as root. GPU/ANE monitoring requires sudo.")
-            print("  Run with: sudo python3 monitor_phocus.py\n")
+        # Check for root access (required for powermetrics GPU/ANE data;
+        # IOReport works without it)
+        if not self.ioreport and os.geteuid() != 0:
+            print("  WARNING: Not running as root. GPU/ANE monitoring via powermetrics requires sudo.")
+            print("  Run with: sudo python3 monitor_phocus.py (or pass --sudo-if-needed)\n")
 
         # Find Phocus process
         self.phocus_pid = self._find_phocus()
@@ -1029,9 +1885,13 @@ class PhocusMonitor:
         input_thread = threading.Thread(target=self._input_listener, daemon=True)
         input_thread.start()
 
+        # Start background thread for CSV output
+        self._start_csv_writer()
+
         start_time = time.time()
         sample_count = 0
         phocus_wait_printed = False
+        next_sample = time.monotonic()  # Deadline of the next sample
 
         try:
             while self.running:
@@ -1050,20 +1910,19 @@ class PhocusMonitor:
                     sample_count += 1
                     phocus_wait_printed = False
 
-                    # Format current metrics for display
-                    mem = self.memory_mb[-1] / 1024  # MB -> GB
-                    gpu = self.gpu_percent[-1]
-                    cpu = self.cpu_percent[-1]
-                    gpu_pwr = self.gpu_power_mw[-1] / 1000  # mW -> W
-                    ane_pwr = self.ane_power_mw[-1] / 1000  # mW -> W
-                    elapsed = (time.time() - start_time) / 60
-
-                    # Show ANE only when active (>0) to save display space
-                    ane_str = f" | ANE:{ane_pwr:.1f}W" if ane_pwr > 0 else ""
-
                     # Single-line status update (overwrites previous)
-                    status = (f"\r[{elapsed:5.1f}m] Mem:{mem:5.1f}GB | GPU:{gpu:5.1f}% | "
-                              f"CPU:{cpu:5.0f}% | Pwr:{gpu_pwr:4.1f}W{ane_str} | #{sample_count}")
+                    last = (self.sample_count - 1) % len(self.timestamps)
+                    ane_mw = self.ane_power_mw[last]
+                    template = STATUS_LINE_ANE if ane_mw > 0 else STATUS_LINE
+                    status = template.format(
+                        elapsed=(time.time() - start_time) / 60,
+                        mem=self.memory_mb[last] / 1024,                  # MB -> GB
+                        gpu=self.gpu_percent[last] / GPU_PERCENT_SCALE,
+                        cpu=self.cpu_percent[last],
+                        gpu_pwr=self.gpu_power_mw[last] / 1000,           # mW -> W
+                        ane_pwr=ane_mw / 1000,                            # mW -> W
+                        count=sample_count,
+                    )
                     print(status, end='', flush=True)
                 else:
                     # Phocus not found - only print waiting message once
@@ -1072,7 +1931,16 @@ class PhocusMonitor:
                               end='', flush=True)
                         phocus_wait_printed = True
 
-                time.sleep(self.interval)
+                # Sleep until the next deadline rather than a full interval,
+                # so time spent sampling doesn't stretch the period. If
+                # we've fallen behind, skip the missed ticks instead of
+                # sampling back-to-back to catch up.
+                next_sample += self.interval
+                remaining = next_sample - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+                else:
+                    next_sample = time.monotonic()
 
         except KeyboardInterrupt:
             print("\n\nStopping...")
@@ -1080,14 +1948,27 @@ class PhocusMonitor:
         # =====================================================================
         # Cleanup and save output
         # =====================================================================
-        self.running = False
-        print(f"\nCollected {len(self.timestamps)} samples, {len(self.annotations)} annotations.")
+        self._stop()
+        self.metric_pool.shutdown(wait=True)
+        self._stop_powermetrics()
+        print(f"\nCollected {self.sample_count} samples, {len(self.annotations)} annotations.")
+        if self.max_samples and self.sample_count > self.max_samples:
+            print(f"Graphing the latest {self.max_samples} samples (--max-samples); "
+                  "the CSV has all of them.")
+
+        # Tell the CSV writer no more samples are coming, so it finishes the
+        # file while the plot renders
+        self.csv_queue.put(None)
 
-        if self.timestamps:
-            self._save_csv()
-            self._generate_plot()
-        else:
-            print("No data collected - Phocus may not have been running.")
+        try:
+            if self.sample_count:
+                self._generate_plot()
+            else:
+                print("No data collected - Phocus may not have been running.")
+        finally:
+            # Always wait for the (daemon) writer, so the CSV is complete
+            # even if plotting fails or is interrupted
+            self._finish_csv()
 
 
 def validate_args(args):
@@ -1115,6 +1996,10 @@ def validate_args(args):
         if args.duration < args.interval:
             return False, "Error: --duration must be at least as long as --interval"
 
+    # Validate max samples if provided
+    if args.max_samples is not None and args.max_samples < 2:
+        return False, "Error: --max-samples must be at least 2"
+
     return True, None
 
 
@@ -1129,13 +2014,16 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-  sudo python3 monitor_phocus.py                    # Monitor indefinitely
-  sudo python3 monitor_phocus.py -d 300             # Monitor for 5 minutes
-  sudo python3 monitor_phocus.py -i 0.5             # Sample every 0.5 seconds
-  sudo python3 monitor_phocus.py -o ~/results/test  # Save to ~/results/test.*
-  sudo python3 monitor_phocus.py -o ~/results/      # Save to ~/results/ with default name
-
-Note: sudo is required for GPU and Neural Engine monitoring via powermetrics.
+  python3 monitor_phocus.py                    # Monitor indefinitely
+  python3 monitor_phocus.py -d 300             # Monitor for 5 minutes
+  python3 monitor_phocus.py -i 0.5             # Sample every 0.5 seconds
+  python3 monitor_phocus.py -o ~/results/test  # Save to ~/results/test.*
+  python3 monitor_phocus.py -o ~/results/      # Save to ~/results/ with default name
+  python3 monitor_phocus.py -m 7200            # Keep only the latest 7200 samples
+
+Note: sudo is only required for GPU and Neural Engine monitoring when IOReport
+is unavailable and the script falls back to powermetrics. --sudo-if-needed
+checks for that and re-runs the script under sudo only then.
         """
     )
 
@@ -1158,6 +2046,17 @@ Note: sudo is required for GPU and Neural Engine monitoring via powermetrics.
         metavar='PATH',
         help='Output path: directory (uses default name) or full path (default: ./phocus_monitor_TIMESTAMP)'
     )
+    parser.add_argument(
+        '--max-samples', '-m',
+        type=int,
+        metavar='N',
+        help='Keep only the most recent N samples in a fixed-size buffer (default: keep all)'
+    )
+    parser.add_argument(
+        '--sudo-if-needed',
+        action='store_true',
+        help='Re-run under sudo if IOReport is unavailable and powermetrics (root only) is needed'
+    )
     parser.add_argument(
         '--version', '-v',
         action='version',
@@ -1172,9 +2071,18 @@ Note: sudo is required for GPU and Neural Engine monitoring via powermetrics.
         print(error_msg)
         sys.exit(1)
 
+    # Only the powermetrics fallback needs root - re-run under sudo for it
+    # (replacing this process, so the password prompt is in this terminal)
+    if args.sudo_if_needed and os.geteuid() != 0 and not _ioreport_available():
+        print("IOReport unavailable - GPU/ANE monitoring needs powermetrics, which requires root.")
+        print("Re-running with sudo...", flush=True)
+        argv = [arg for arg in sys.argv[1:] if arg != '--sudo-if-needed']
+        os.execv(SUDO_PATH, [SUDO_PATH, sys.executable, os.path.abspath(sys.argv[0]), *argv])
+
     # Create monitor and run
     try:
-        monitor = PhocusMonitor(interval=args.interval, output_base=args.output)
+        monitor = PhocusMonitor(interval=args.interval, output_base=args.output,
+                                max_samples=args.max_samples)
         monitor.run(duration=args.duration)
     except KeyboardInterrupt:
         # Handle Ctrl+C during initialization